@@ -2,7 +2,9 @@
 Grasshopper Python component for generating MatCap and grid texture file paths.
 
 Inputs:
-    selMatCap (int): Material capture selection number
+    selMatCap (int): Material capture selection number (a non-integer value
+        is truncated to int when the file name is formatted, e.g. 5.5 ->
+        "matcap105.png"; values between ranges such as 32.5 give "")
     tex_fill (int): Index for fill type (0, 1, 2, 3, 4, 5)
     tex_space (int): Index for space type (0, 1, 2)
     tex_gutter (int): Index for gutter width type (0, 1, 2)
@@ -15,50 +17,89 @@ Output:
     path_to_texture (str): Complete file path to the selected texture
 """
 
-# Hard-coded arrays for fill, space, and gutter types
-fillArray = ["tra", "whi", "c1", "c2", "c3", "c4", "c5"]
-spaceArray = ["tra", "whi", "bla"]
-gutterArray = ["w1", "w2", "w3", "w4", "w5"]
-radiusArray = ["r1", "r2", "r3", "r4"]
-
-
-# Validate inputs
-if selMatCap is None:
-    path_to_texture = ""
-elif selMatCap <= 32:
-    # MatCap range: 1-32
-    # Format: base_path + "matcap" + (100 + selMatCap) + ".png"
-    # Example: selMatCap=5 -> "matcap105.png"
-    matcap_number = 100 + selMatCap
-    path_to_texture = base_path + "matcap" + str(matcap_number).zfill(3) + ".png"
-
-elif selMatCap >= 33 and selMatCap <= 48:
-    # Grid range: 33-48
-    # Format: grid_(number)_(gutterArray)_(radiusArray)_(fillArray)_(spaceArray).png
-    # Example: selMatCap=35, tex_gutter=2, tex_radius=1, tex_fill=0, tex_space=0 -> "grid_04_w3_r2_tra_tra.png"
-    grid_number = selMatCap - 31
-
-    # Validate indices
-    gutter_idx = max(0, min(4, tex_gutter if tex_gutter is not None else 0))
-    radius_idx = max(0, min(3, tex_radius if tex_radius is not None else 0))
-    fill_idx = max(0, min(6, tex_fill if tex_fill is not None else 0))
-    space_idx = max(0, min(2, tex_space if tex_space is not None else 0))
-
-    gutter_str = gutterArray[gutter_idx]
-    radius_str = radiusArray[radius_idx]
-    fill_str = fillArray[fill_idx]
-    space_str = spaceArray[space_idx]
-
-    path_to_texture = grid_path + "grid_" + str(grid_number).zfill(2) + "_" + gutter_str + "_" + radius_str + "_" + fill_str + "_" + space_str + ".png"
-
-elif selMatCap >= 49:
-    # Pattern range: 49+
-    # Format: pattern_path + "matcap" + (100 + (selMatCap - 48)) + ".png"
-    # Example: selMatCap=49 -> "matcap101.png"
-    # Example: selMatCap=50 -> "matcap102.png"
-    pattern_number = 100 + (selMatCap - 48)
-    path_to_texture = pattern_path + "matcap" + str(pattern_number).zfill(3) + ".png"
-
-else:
-    # Out of range - return empty
-    path_to_texture = ""
+import os
+from collections import OrderedDict
+import scriptcontext as sc
+
+# Hard-coded token tables for fill, space, gutter, and radius types
+fillArray = ("tra", "whi", "c1", "c2", "c3", "c4", "c5")
+spaceArray = ("tra", "whi", "bla")
+gutterArray = ("w1", "w2", "w3", "w4", "w5")
+radiusArray = ("r1", "r2", "r3", "r4")
+
+# Shared result for missing input (not-yet-wired sliders)
+_EMPTY = ""
+
+# Results are deterministic per input tuple, so keep them across solves.
+# sc.sticky is shared by every script component, so all BuildTexturePath
+# instances in the definition resolve each unique input tuple only once.
+_CACHE_MAX = 4096
+_cache = sc.sticky.setdefault("_texpath_lru_v1", OrderedDict())
+
+
+def _clip(idx, hi):
+    """Clamp an optional index into [0, hi] (None maps to 0)"""
+    if idx is None or idx < 0:
+        return 0
+    return hi if idx > hi else idx
+
+
+def _matcap(base, n):
+    """MatCap/pattern file path: base / "matcap" + (100 + n) + ".png" """
+    return os.path.join(base, f"matcap{100 + int(n):03d}.png")
+
+
+def _grid(grid_path, n, tex_fill, tex_space, tex_gutter, tex_radius):
+    """Grid file path: grid_(number)_(gutter)_(radius)_(fill)_(space).png"""
+    # Validate indices and look up tokens
+    gutter_str = gutterArray[_clip(tex_gutter, 4)]
+    radius_str = radiusArray[_clip(tex_radius, 3)]
+    fill_str = fillArray[_clip(tex_fill, 6)]
+    space_str = spaceArray[_clip(tex_space, 2)]
+
+    return os.path.join(grid_path, f"grid_{int(n) - 31:02d}_{gutter_str}_{radius_str}_{fill_str}_{space_str}.png")
+
+
+def _compute(selMatCap, tex_fill, tex_space, tex_gutter, tex_radius, base_path, grid_path, pattern_path):
+    """Build the texture path for one set of inputs (uncached)"""
+    if selMatCap <= 32:
+        # MatCap range: 1-32
+        # Example: selMatCap=5 -> "matcap105.png"
+        return _matcap(base_path, selMatCap)
+
+    elif selMatCap >= 33 and selMatCap <= 48:
+        # Grid range: 33-48
+        # Example: selMatCap=35, tex_gutter=2, tex_radius=1, tex_fill=0, tex_space=0 -> "grid_04_w3_r2_tra_tra.png"
+        return _grid(grid_path, selMatCap, tex_fill, tex_space, tex_gutter, tex_radius)
+
+    elif selMatCap >= 49:
+        # Pattern range: 49+
+        # Example: selMatCap=49 -> "matcap101.png"
+        # Example: selMatCap=50 -> "matcap102.png"
+        return _matcap(pattern_path, selMatCap - 48)
+
+    else:
+        # Between ranges - return empty
+        return _EMPTY
+
+
+def build_texture_path(selMatCap, tex_fill, tex_space, tex_gutter, tex_radius, base_path, grid_path, pattern_path):
+    """Return the texture path, memoized (LRU) on the full input tuple"""
+    # Missing input short-circuits without touching (or polluting) the cache
+    if selMatCap is None:
+        return _EMPTY
+
+    key = (selMatCap, tex_fill, tex_space, tex_gutter, tex_radius, base_path, grid_path, pattern_path)
+    path = _cache.get(key)
+    if path is None:
+        path = _cache[key] = _compute(*key)
+        # Evict the least recently used entry to keep the cache bounded
+        if len(_cache) > _CACHE_MAX:
+            _cache.popitem(last=False)
+    else:
+        _cache.move_to_end(key)
+    return path
+
+
+path_to_texture = build_texture_path(
+    selMatCap, tex_fill, tex_space, tex_gutter, tex_radius, base_path, grid_path, pattern_path)
@@ -1,18 +1,12 @@
-import Rhino
 import scriptcontext as sc
-import System.Drawing as Drawing
-import System.Drawing.Imaging as Imaging
-import System
 import os
 import time
 import datetime
-
-# OSC imports for sending messages to Processing
-import clr
-clr.AddReference("System")
-from System.Net import IPEndPoint, IPAddress
-from System.Net.Sockets import UdpClient
 import struct
+import types
+import threading
+import queue
+import random
 
 # ============================================================================
 # GRASSHOPPER BATCH IMAGE SAVE COMPONENT
@@ -48,62 +42,211 @@ import struct
 # NOTE: This component uses rising-edge trigger detection via sc.sticky
 # ============================================================================
 
-def send_osc_message(address, value, ip="127.0.0.1", port=7010, retries=3):
+# Precompiled OSC argument packers and type tags
+_OSC_INT = struct.Struct('>i')
+_OSC_FLOAT = struct.Struct('>f')
+_OSC_TAG_INT = b',i\0\0'
+_OSC_TAG_FLOAT = b',f\0\0'
+_OSC_TAG_STR = b',s\0\0'
+
+# OSC bundle header: "#bundle" + immediate timetag (0x00000000_00000001)
+_OSC_BUNDLE_HEADER = b'#bundle\0' + struct.pack('>II', 0, 1)
+
+# Output filename templates; widths are fixed literals, never interpolated
+_FILENAME_TAIL_FMT = "{}{}_{:03d}.png"   # [_midfix][_suffix]_NNN.png
+_FILENAME_FMT = "{}_{}{}"                # prefix_view + tail
+
+# Pause after /gh_shutter_trigger so the shutter sound lines up with the frame
+SHUTTER_LEAD_IN = 0.1  # seconds
+
+# -ViewCaptureToFile command up to the opening quote of the output path
+_CAPTURE_CMD_PREFIX = '-ViewCaptureToFile Width=%d Height=%d TransparentBackground=Yes "'
+
+# Keep log lines for the debug_output pin; set False to skip buffering them
+# (console and log file output are unaffected)
+DEBUG_ENABLED = True
+
+# Also dump raw view_names input to logs\viewnames_debug.txt (diagnostics only;
+# the same details are always written to the main log)
+DEBUG_VIEWNAMES_FILE = False
+
+# Batch logs and debug files
+LOG_DIR = "x:\\Shaw\\Helmets\\November\\Grasshopper\\Python\\PNG_Batch_Save\\logs"
+
+# PNG signature and IHDR width/height (big-endian, bytes 16-24)
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_PNG_IHDR_SIZE = struct.Struct('>II')
+
+def _rt():
     """
-    Send OSC message to Processing with retry logic
+    Lazily load Rhino and CLR runtime handles, cached in sc.sticky
+
+    Only called once a capture actually fires, so idle solves never pay for
+    CLR type resolution.
+    """
+    rt = sc.sticky.get("_batch_rt")
+    if rt:
+        return rt
+
+    import Rhino
+
+    # OSC imports for sending messages to Processing
+    import clr
+    clr.AddReference("System")
+    from System.Net import IPEndPoint, IPAddress
+    from System.Net.Sockets import UdpClient
+
+    # One UDP client and endpoint set reused for the component lifetime;
+    # UDP is connectionless so nothing needs re-establishing between sends
+    rt = types.SimpleNamespace(
+        Rhino=Rhino,
+        IPEndPoint=IPEndPoint, IPAddress=IPAddress, UdpClient=UdpClient,
+        client=UdpClient(), endpoints={}, osc_addresses={}, osc_packets={})
+    sc.sticky["_batch_rt"] = rt
+    return rt
+
+def _osc_endpoint(rt, ip, port):
+    """Return the cached IPEndPoint for ip:port, creating it on first use"""
+    key = (ip, port)
+    endpoint = rt.endpoints.get(key)
+    if endpoint is None:
+        endpoint = rt.endpoints[key] = rt.IPEndPoint(rt.IPAddress.Parse(ip), port)
+    return endpoint
+
+def _osc_pad(data):
+    """Zero-pad bytes to a multiple of 4 (OSC alignment)"""
+    return data + b'\0' * (-len(data) & 3)
+
+def _osc_address(rt, address):
+    """Return the null-terminated, 4-byte padded OSC address bytes (cached)"""
+    addr_bytes = rt.osc_addresses.get(address)
+    if addr_bytes is None:
+        addr_bytes = rt.osc_addresses[address] = _osc_pad((address + '\0').encode('utf-8'))
+    return addr_bytes
+
+def _png_size(path):
+    """
+    Read (width, height) from a PNG file's IHDR chunk
+
+    Only the first 24 bytes are read, so the saved image is never decoded
+    just to verify its dimensions.
+    """
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if len(header) < 24 or header[:8] != _PNG_SIGNATURE:
+        raise ValueError("Not a valid PNG file: " + path)
+    return _PNG_IHDR_SIZE.unpack_from(header, 16)
+
+def _parse_save_package(mc_save_package):
+    """
+    Split "path,prefix,midfix,suffix,number" into stripped fields
+
+    Results are cached in sc.sticky per raw string. Returns a tuple of at
+    most 5 fields; fewer than 5 means the package is incomplete.
+    """
+    cache = sc.sticky.setdefault("_batch_pkg_cache", {})
+    parts = cache.get(mc_save_package)
+    if parts is None:
+        # maxsplit stops scanning after the 5th field; extra fields are ignored
+        parts = tuple(p.strip() for p in mc_save_package.split(',', 5)[:5])
+        if len(cache) >= 64:
+            cache.clear()
+        cache[mc_save_package] = parts
+    return parts
+
+def _named_view_indices(doc, rebuild=False):
+    """
+    Map named view name -> index for doc, cached in sc.sticky
+
+    The cache is keyed on the document's runtime serial number and the
+    named view count, so switching documents or adding/removing a view
+    invalidates it automatically. A rename or replace that keeps the count
+    is not seen here; use _find_named_view, which checks the name at the
+    cached index. First match wins, as with a linear scan.
+    """
+    key = (doc.RuntimeSerialNumber, doc.NamedViews.Count)
+    cached = sc.sticky.get("_batch_named_views")
+    if cached and cached[0] == key and not rebuild:
+        return cached[1]
+
+    indices = {}
+    for i, named_view in enumerate(doc.NamedViews):
+        indices.setdefault(named_view.Name, i)
+    sc.sticky["_batch_named_views"] = (key, indices)
+    return indices
+
+def _find_named_view(doc, name):
+    """
+    Return the index of the named view called name, or -1 if missing
+
+    A cached index is only trusted if the view stored there still has this
+    name; otherwise (e.g. a rename or replace that kept the count) the map
+    is rebuilt from the table before answering.
+    """
+    views = doc.NamedViews
+    index = _named_view_indices(doc).get(name, -1)
+    if index < 0 or index >= views.Count or views[index].Name != name:
+        index = _named_view_indices(doc, rebuild=True).get(name, -1)
+    return index
+
+def build_osc_message(address, value):
+    """
+    Build a single OSC message packet
 
     Args:
         address (str): OSC address pattern (e.g., "/pngBatchStart")
         value: Integer, float, or string value to send
-        ip (str): Target IP address (default: localhost)
-        port (int): Target port (default: 7010 for Processing)
-        retries (int): Number of send attempts before giving up
 
     Returns:
-        bool: True if message sent successfully, False otherwise
+        bytes: Encoded OSC message
     """
+    rt = _rt()
+
+    # Repeated sends (e.g. the shutter trigger) reuse the built packet.
+    # The value type is part of the key so 1 and 1.0 stay distinct.
+    key = (address, type(value), value)
+    message = rt.osc_packets.get(key)
+    if message is not None:
+        return message
+
+    # Address string with null terminator, padded (constant per address)
+    addr_bytes = _osc_address(rt, address)
+
+    # Type tag string (comma + type + null terminator)
+    if isinstance(value, int):
+        type_tag = _OSC_TAG_INT
+        # Pack integer as big-endian
+        value_bytes = _OSC_INT.pack(value)
+    elif isinstance(value, float):
+        type_tag = _OSC_TAG_FLOAT
+        # Pack float as big-endian
+        value_bytes = _OSC_FLOAT.pack(value)
+    else:
+        # String
+        type_tag = _OSC_TAG_STR
+        value_bytes = _osc_pad((str(value) + '\0').encode('utf-8'))
+
+    # Combine all parts
+    message = b''.join((addr_bytes, type_tag, value_bytes))
+    if len(rt.osc_packets) >= 128:
+        rt.osc_packets.clear()
+    rt.osc_packets[key] = message
+    return message
+
+def send_osc_packet(packet, ip="127.0.0.1", port=7010, retries=3):
+    """
+    Send a prebuilt OSC packet (message or bundle) with retry logic
 
-    # Build OSC message once
-    try:
-        # Address string with null terminator
-        addr_bytes = bytearray(address + '\0', 'utf-8')
-        # Pad to multiple of 4
-        while len(addr_bytes) % 4 != 0:
-            addr_bytes.append(0)
-
-        # Type tag string (comma + type + null terminator)
-        if isinstance(value, int):
-            type_tag = bytearray(',i\0\0', 'utf-8')
-            # Pack integer as big-endian
-            value_bytes = bytearray(struct.pack('>i', value))
-        elif isinstance(value, float):
-            type_tag = bytearray(',f\0\0', 'utf-8')
-            # Pack float as big-endian
-            value_bytes = bytearray(struct.pack('>f', value))
-        else:
-            # String
-            type_tag = bytearray(',s\0\0', 'utf-8')
-            str_bytes = bytearray(str(value) + '\0', 'utf-8')
-            while len(str_bytes) % 4 != 0:
-                str_bytes.append(0)
-            value_bytes = str_bytes
-
-        # Combine all parts
-        message = bytes(addr_bytes + type_tag + value_bytes)
-
-    except Exception as e:
-        print("ERROR: OSC message build failed: " + str(e))
-        return False
-
-    # Try sending with retries
-    endpoint = IPEndPoint(IPAddress.Parse(ip), port)
+    Returns:
+        bool: True if packet sent successfully, False otherwise
+    """
+    rt = _rt()
+    endpoint = _osc_endpoint(rt, ip, port)
 
     for attempt in range(retries):
         try:
-            # Create new UDP client for each attempt
-            client = UdpClient()
-            client.Send(message, len(message), endpoint)
-            client.Close()
+            # Reuse the persistent UDP client
+            rt.client.Send(packet, len(packet), endpoint)
 
             # Log success on retry
             if attempt > 0:
@@ -112,13 +255,128 @@ def send_osc_message(address, value, ip="127.0.0.1", port=7010, retries=3):
             return True
 
         except Exception as e:
+            # Replace a client that may have been left in a bad state
+            try:
+                rt.client.Close()
+            except:
+                pass
+            rt.client = rt.UdpClient()
+
             if attempt < retries - 1:
                 print("  OSC send attempt {}/{} failed, retrying...".format(attempt + 1, retries))
-                time.sleep(0.01)  # Small delay before retry
+                # Full-jitter exponential backoff, capped at 200 ms
+                time.sleep(random.uniform(0, min(0.2, 0.01 * (2 ** attempt))))
             else:
                 print("ERROR: OSC send failed after {} attempts: {}".format(retries, str(e)))
                 return False
 
+def _wait_for_file(path, timeout=0.5, interval=0.01):
+    """
+    Poll until path exists with a non-zero size
+
+    Returns as soon as the file is written instead of sleeping a fixed
+    amount; gives up (returns False) after timeout seconds.
+    """
+    # Bind the polled functions once; this loop runs every few ms
+    now = time.time
+    sleep = time.sleep
+    getsize = os.path.getsize
+    deadline = now() + timeout
+    while True:
+        try:
+            if getsize(path) > 0:
+                return True
+        except OSError:
+            pass
+        if now() >= deadline:
+            return False
+        sleep(interval)
+
+def _write_log_lines(log_file, lines):
+    """Write and flush a batch of log lines (a failed write only warns)"""
+    if not lines:
+        return
+    try:
+        log_file.write("\n".join(lines) + "\n")
+        log_file.flush()
+    except Exception as e:
+        print("WARNING: Log write failed: " + str(e))
+
+def _log_writer(lines, log_file, stop, max_batch=32, max_delay=0.25):
+    """
+    Drain log lines from a queue into log_file on a background thread
+
+    Lines are written in batches (every max_batch lines or max_delay
+    seconds) so disk latency stays off the capture thread. Once stop is
+    set, the pending batch is written and the thread exits; the caller
+    drains anything still queued and closes the file.
+    """
+    pending = []
+    last_flush = time.time()
+    while not stop.is_set():
+        try:
+            pending.append(lines.get(timeout=max_delay))
+        except queue.Empty:
+            pass
+        if pending and (len(pending) >= max_batch or
+                        time.time() - last_flush >= max_delay):
+            _write_log_lines(log_file, pending)
+            pending = []
+            last_flush = time.time()
+    _write_log_lines(log_file, pending)
+
+def send_osc_message(address, value, ip="127.0.0.1", port=7010, retries=3):
+    """
+    Send OSC message to Processing with retry logic
+
+    Args:
+        address (str): OSC address pattern (e.g., "/pngBatchStart")
+        value: Integer, float, or string value to send
+        ip (str): Target IP address (default: localhost)
+        port (int): Target port (default: 7010 for Processing)
+        retries (int): Number of send attempts before giving up
+
+    Returns:
+        bool: True if message sent successfully, False otherwise
+    """
+
+    # Build OSC message once
+    try:
+        message = build_osc_message(address, value)
+    except Exception as e:
+        print("ERROR: OSC message build failed: " + str(e))
+        return False
+
+    return send_osc_packet(message, ip=ip, port=port, retries=retries)
+
+def build_osc_bundle(packets):
+    """Wrap prebuilt OSC messages in one immediate '#bundle' packet"""
+    parts = [_OSC_BUNDLE_HEADER]
+    for packet in packets:
+        parts.append(_OSC_INT.pack(len(packet)))
+        parts.append(packet)
+    return b''.join(parts)
+
+def send_osc_bundle(messages, ip="127.0.0.1", port=7010, retries=3):
+    """
+    Send several OSC messages in a single UDP datagram
+
+    Args:
+        messages: Iterable of (address, value) pairs
+        ip, port, retries: As for send_osc_message
+
+    Returns:
+        bool: True if the bundle was sent (or there was nothing to send)
+    """
+    try:
+        packets = [build_osc_message(address, value) for address, value in messages]
+    except Exception as e:
+        print("ERROR: OSC bundle build failed: " + str(e))
+        return False
+    if not packets:
+        return True
+    return send_osc_packet(build_osc_bundle(packets), ip=ip, port=port, retries=retries)
+
 def gen_run_id():
     """Generate unique run ID with timestamp"""
     return datetime.datetime.now().strftime("%Y%m%d-%H%M%S-%f")
@@ -137,70 +395,76 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
     This prevents re-triggering on every component re-compute
     """
 
-    status_msgs = []
-    directory_status = ""
-    views_status = []
-    capture_status = []
-    file_status = []
-    debug_msgs = []  # Capture all print output
-
     # ========================================================================
     # RISING EDGE DETECTION: Only execute on trigger 0→1 transition
     # ========================================================================
+    # Idle solves return here before any other work is done
     sticky_key = "capture_views_last_trigger_" + str(ghenv.Component.InstanceGuid)
     last_trigger = sc.sticky.get(sticky_key, False)
-
-    # Update sticky with current trigger state
     sc.sticky[sticky_key] = trigger
 
-    # If trigger is currently False, just wait
     if not trigger:
-        main_status = "⏸ Trigger is False - ready for next capture"
-        if status_msgs:
-            main_status += " | " + "; ".join(status_msgs)
-        return main_status, "", "", "", "", ""
-
-    # If trigger was already True, we're waiting for reset
-    if last_trigger == True:
-        main_status = "⏳ Waiting for trigger reset (toggle OFF then ON to capture again)"
-        if status_msgs:
-            main_status += " | " + "; ".join(status_msgs)
-        return main_status, "", "", "", "", ""
+        # Trigger is currently False, just wait
+        return "⏸ Trigger is False - ready for next capture", "", "", "", "", ""
+    if last_trigger:
+        # Trigger was already True, we're waiting for reset
+        return "⏳ Waiting for trigger reset (toggle OFF then ON to capture again)", "", "", "", "", ""
+
+    status_msgs = []
+    directory_status = ""
+    views_status = []
+    capture_status = []
+    file_status = []
+    debug_msgs = []  # Capture all print output
+
+    # Rising edge confirmed - load Rhino/CLR handles now
+    rt = _rt()
+    Rhino = rt.Rhino
 
     # ========================================================================
     # EXECUTION STARTING - Create log file NOW
     # ========================================================================
     # Setup debug log file - use explicit path
-    log_dir = "x:\\Shaw\\Helmets\\November\\Grasshopper\\Python\\PNG_Batch_Save\\logs"
+    log_dir = LOG_DIR
     if not os.path.exists(log_dir):
         try:
-            os.makedirs(log_dir)
-        except:
+            os.makedirs(log_dir, exist_ok=True)
+        except OSError:
             log_dir = "C:\\Temp"  # Fallback
 
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     log_file_path = os.path.join(log_dir, "batch_capture_{}.txt".format(timestamp))
 
-    # Create a mutable container to hold the log file reference
-    log_state = {'file': None}
+    # Log lines are queued here and written by a background thread
+    log_state = {'queue': None, 'thread': None, 'stop': None, 'file': None}
 
     try:
-        log_state['file'] = open(log_file_path, 'w')
+        log_file = log_state['file'] = open(log_file_path, 'w')
+        lines = queue.Queue()
+        log_state['stop'] = threading.Event()
+        log_state['thread'] = threading.Thread(
+            target=_log_writer, args=(lines, log_file, log_state['stop']))
+        log_state['thread'].daemon = True
+        log_state['thread'].start()
+        # Only route lines to the queue once the writer is running
+        log_state['queue'] = lines
     except Exception as e:
         print("WARNING: Could not open log file: " + str(e))
 
     def log(msg):
         """Helper to log to debug_msgs, console, and file with timestamps"""
         timestamp = datetime.datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        msg_str = "[{}] {}".format(timestamp, str(msg))
-        debug_msgs.append(msg_str)
+        msg_str = ''.join(('[', timestamp, '] ', str(msg)))
+        if DEBUG_ENABLED:
+            debug_msgs.append(msg_str)
         print(msg_str)
-        if log_state['file']:
-            try:
-                log_state['file'].write(msg_str + "\n")
-                log_state['file'].flush()  # Immediately flush to disk
-            except Exception as e:
-                print("WARNING: Log write failed: " + str(e))
+        if log_state['queue']:
+            log_state['queue'].put(msg_str)
+
+    def _pack(main_status, directory_status=""):
+        """Assemble the six output strings; the status lists are joined only here"""
+        return (main_status, directory_status, "\n".join(views_status),
+                "\n".join(capture_status), "\n".join(file_status), "\n".join(debug_msgs))
 
     # ========================================================================
     # EXECUTION STARTS HERE: Trigger just went from False→True (rising edge)
@@ -225,12 +489,12 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
         log("[STEP 1] Parsing mc_save_package...")
         if not mc_save_package or not isinstance(mc_save_package, str):
             log("ERROR: mc_save_package is empty or invalid")
-            return "ERROR: mc_save_package string is required", "", "", "", "", "\n".join(debug_msgs)
+            return _pack("ERROR: mc_save_package string is required")
 
-        parts = [p.strip() for p in mc_save_package.split(',')]
+        parts = _parse_save_package(mc_save_package)
         if len(parts) < 5:
             log("ERROR: mc_save_package has {} parts, need 5".format(len(parts)))
-            return "ERROR: mc_save_package must have 5 comma-separated values", "", "", "", "", "\n".join(debug_msgs)
+            return _pack("ERROR: mc_save_package must have 5 comma-separated values")
 
         file_path = parts[0]
         file_prefix = parts[1]
@@ -253,29 +517,36 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
         # Validate path/prefix
         if not file_path or not file_prefix:
             log("ERROR: Missing file_path or file_prefix")
-            return "ERROR: mc_save_package missing file_path or file_prefix", "", "", "", "", "\n".join(debug_msgs)
+            return _pack("ERROR: mc_save_package missing file_path or file_prefix")
+
+        # The output path is passed quoted to -ViewCaptureToFile; an embedded
+        # quote would end it early and the command would silently fail
+        if '"' in file_path + file_prefix + file_midfix + file_suffix:
+            log("ERROR: mc_save_package contains a double quote")
+            return _pack("ERROR: mc_save_package path/name parts must not contain '\"'")
 
         # ====================================================================
         # STEP 2: Process view names and size
         # ====================================================================
         log("[STEP 2] Processing view names...")
 
-        # WRITE DEBUG INFO TO SEPARATE FILE IMMEDIATELY
-        debug_file_path = "x:\\Shaw\\Helmets\\November\\Grasshopper\\Python\\PNG_Batch_Save\\logs\\viewnames_debug.txt"
-        try:
-            with open(debug_file_path, 'w') as df:
-                df.write("=" * 70 + "\n")
-                df.write("VIEW_NAMES DEBUG INFO\n")
-                df.write("=" * 70 + "\n")
-                df.write("Type: {}\n".format(type(view_names)))
-                df.write("Repr: {}\n".format(repr(view_names)))
-                df.write("Str: {}\n".format(str(view_names)))
-                df.write("Has comma: {}\n".format(',' in str(view_names)))
-                df.write("Is string: {}\n".format(isinstance(view_names, str)))
-                df.write("Is list: {}\n".format(isinstance(view_names, list)))
-                df.write("=" * 70 + "\n")
-        except Exception as e:
-            print("WARNING: Could not write debug file: " + str(e))
+        # Optional separate debug file (same directory as the batch log)
+        if DEBUG_VIEWNAMES_FILE:
+            debug_file_path = os.path.join(log_dir, "viewnames_debug.txt")
+            try:
+                with open(debug_file_path, 'w') as df:
+                    df.write("=" * 70 + "\n")
+                    df.write("VIEW_NAMES DEBUG INFO\n")
+                    df.write("=" * 70 + "\n")
+                    df.write("Type: {}\n".format(type(view_names)))
+                    df.write("Repr: {}\n".format(repr(view_names)))
+                    df.write("Str: {}\n".format(str(view_names)))
+                    df.write("Has comma: {}\n".format(',' in str(view_names)))
+                    df.write("Is string: {}\n".format(isinstance(view_names, str)))
+                    df.write("Is list: {}\n".format(isinstance(view_names, list)))
+                    df.write("=" * 70 + "\n")
+            except Exception as e:
+                print("WARNING: Could not write debug file: " + str(e))
 
         log("  DEBUG: view_names type = {}".format(type(view_names)))
         log("  DEBUG: view_names value = {}".format(repr(view_names)))
@@ -306,18 +577,18 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
             # Check if comma-delimited (OSC format)
             if ',' in view_names:
                 log("  Parsing comma-delimited view list from OSC...")
-                view_names = [v.strip() for v in view_names.split(',') if v.strip()]
+                view_names = [v for v in (v.strip() for v in view_names.split(',')) if v]
                 log("  Parsed {} views from comma-delimited string".format(len(view_names)))
             else:
                 # Fallback to newline-delimited (legacy format)
-                view_names = [v.strip() for v in view_names.split('\n') if v.strip()]
+                view_names = [v for v in (v.strip() for v in view_names.split('\n')) if v]
                 if len(view_names) == 0:
                     view_names = [view_names]
         # If already a proper list, keep it as is
 
         if not view_names or len(view_names) == 0:
             log("ERROR: view_names list is empty")
-            return "ERROR: view_names list is empty", "", "", "", "", "\n".join(debug_msgs)
+            return _pack("ERROR: view_names list is empty")
 
         num_views = len(view_names)
         log("  Total views to capture: {}".format(num_views))
@@ -330,11 +601,11 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
                 size_value = int(size)
         except:
             log("ERROR: Invalid size value")
-            return "ERROR: size must be a single integer value", "", "", "", "", "\n".join(debug_msgs)
+            return _pack("ERROR: size must be a single integer value")
 
         if size_value <= 0:
             log("ERROR: size must be positive")
-            return "ERROR: size must be a positive integer", "", "", "", "", "\n".join(debug_msgs)
+            return _pack("ERROR: size must be a positive integer")
 
         log("  Resolution: {}x{} pixels".format(size_value, size_value))
 
@@ -349,7 +620,7 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
         if not os.path.exists(file_path):
             directory_status = "ERROR: Directory not found: " + file_path
             log("ERROR: Directory does not exist")
-            return "Directory Error", directory_status, "", "", "", "\n".join(debug_msgs)
+            return _pack("Directory Error", directory_status)
 
         directory_status = "Directory OK: " + file_path
         log("  Directory exists: " + file_path)
@@ -371,18 +642,17 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
         active_view = sc.doc.Views.ActiveView
         if not active_view:
             log("ERROR: No active view found")
-            return "ERROR: No active view", directory_status, "", "", "", "\n".join(debug_msgs)
+            return _pack("ERROR: No active view", directory_status)
 
         viewport = active_view.ActiveViewport
         original_display_mode = viewport.DisplayMode
         log("  Active view found, original display mode saved")
 
-        # Find target display mode
-        target_mode = None
+        # Find target display mode (case-insensitive, first match wins)
+        display_modes = {}
         for mode in Rhino.Display.DisplayModeDescription.GetDisplayModes():
-            if mode.EnglishName.lower() == viewmode.lower():
-                target_mode = mode
-                break
+            display_modes.setdefault(mode.EnglishName.lower(), mode)
+        target_mode = display_modes.get(viewmode.lower())
 
         if target_mode:
             viewport.DisplayMode = target_mode
@@ -419,40 +689,57 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
         ok_count = 0
         err_count = 0
 
-        for idx in range(num_views):
-            view_name = view_names[idx]
-            width = height = size_value
-
-            log("")
-            log("  [{}/{}] Processing: {}".format(idx+1, num_views, view_name))
-            log("  [M-CHANNEL] mc_saturation_fg = {}".format(mc_saturation_fg))
-            capture_status.append("=== VIEW {} OF {} ===".format(idx+1, num_views))
-            capture_status.append("Name: {}, Resolution: {}x{}".format(view_name, width, height))
-
-            # Search for named view
-            view_found = False
-            named_view_index = -1
-
-            for i in range(sc.doc.NamedViews.Count):
-                if sc.doc.NamedViews[i].Name == view_name:
-                    named_view_index = i
-                    view_found = True
-                    break
-
-            if not view_found:
-                log("    [ERROR] Named view not found: " + view_name)
+        # Filename tail shared by every view: [_midfix][_suffix]_NNN.png
+        filename_tail = _FILENAME_TAIL_FMT.format(
+            "_" + file_midfix if file_midfix else "",
+            "_" + file_suffix if file_suffix else "",
+            file_series_number)
+
+        # Every output name and path is fixed before capture starts:
+        # prefix_view[_midfix][_suffix]_NNN.png
+        filenames = [_FILENAME_FMT.format(file_prefix, v, filename_tail) for v in view_names]
+        full_paths = [os.path.join(file_path, fn) for fn in filenames]
+
+        # Resolve every named view before touching the viewport; views that
+        # can't be captured keep index -1 and are reported in view order below
+        resolved_views = []
+        for idx, view_name in enumerate(view_names):
+            named_view_index = _find_named_view(sc.doc, view_name)
+            if '"' in view_name:
+                # Would break the quoted capture path (see STEP 1)
+                log("  [ERROR] View name contains a double quote: " + view_name)
+                views_status.append("INVALID NAME: " + view_name)
+                named_view_index = -1
+            elif named_view_index >= 0:
+                views_status.append("FOUND: {} at index {}".format(view_name, named_view_index))
+            else:
+                log("  [ERROR] Named view not found: " + view_name)
                 views_status.append("NOT FOUND: " + view_name)
-                err_count += 1
+            resolved_views.append((idx, view_name, named_view_index))
 
+        # Capture command is identical for every view apart from the path
+        # (images are square, so width == height == size_value)
+        cmd_prefix = _CAPTURE_CMD_PREFIX % (size_value, size_value)
+
+        for idx, view_name, named_view_index in resolved_views:
+            if named_view_index < 0:
                 # Send error notification
+                err_count += 1
                 try:
                     send_osc_str("/pngViewError", "{},{},{}".format(run_id, idx+1, view_name))
                 except:
                     pass
                 continue
 
+            width = height = size_value
+
+            log("")
+            log("  [{}/{}] Processing: {}".format(idx+1, num_views, view_name))
+            log("  [M-CHANNEL] mc_saturation_fg = {}".format(mc_saturation_fg))
+            capture_status.append("=== VIEW {} OF {} ===".format(idx+1, num_views))
+            capture_status.append("Name: {}, Resolution: {}x{}".format(view_name, width, height))
+
             log("    [OK] Found at index: {}".format(named_view_index))
-            views_status.append("FOUND: {} at index {}".format(view_name, named_view_index))
 
             try:
                 # Restore the named view
@@ -468,47 +755,36 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
                         pass
                     continue
 
+                # Restore(..., True) already redrew the view, and ViewCaptureToFile
+                # renders the viewport itself, so no extra redraw is needed here
                 log("    [OK] View restored")
 
-                # Reapply display mode
-                if target_mode:
+                # Reapply display mode only if restoring the view changed it
+                if target_mode and viewport.DisplayMode.Id != target_mode.Id:
                     viewport.DisplayMode = target_mode
 
-                # Generate filename
-                per_view_base = "_".join([p for p in ([file_prefix, view_name] +
-                    ([file_midfix] if file_midfix else []) +
-                    ([file_suffix] if file_suffix else [])) if p])
-                filename = "{}_{:03d}.png".format(per_view_base, file_series_number)
-                full_path = os.path.join(file_path, filename)
+                filename = filenames[idx]
+                full_path = full_paths[idx]
 
                 log("    File: " + filename)
 
-                # Force redraw and wait
-                sc.doc.Views.Redraw()
-                time.sleep(0.3)
-
                 # Send shutter sound trigger
                 try:
                     send_osc_message("/gh_shutter_trigger", 1.0)
-                    time.sleep(0.1)  # Audio delay
+                    time.sleep(SHUTTER_LEAD_IN)  # Audio delay
                 except:
                     pass
 
                 # Capture with transparency
-                command_string = '-ViewCaptureToFile Width={} Height={} TransparentBackground=Yes "{}"'.format(
-                    width, height, full_path)
+                command_string = cmd_prefix + full_path + '"'
 
                 command_success = Rhino.RhinoApp.RunScript(command_string, False)
 
                 if command_success:
-                    time.sleep(0.5)  # Wait for file write
-
-                    if os.path.exists(full_path):
-                        # Verify file
-                        saved_image = Drawing.Image.FromFile(full_path)
-                        actual_width = saved_image.Width
-                        actual_height = saved_image.Height
-                        saved_image.Dispose()
+                    # Wait (bounded) for the file write to land
+                    if _wait_for_file(full_path):
+                        # Verify file from its PNG header
+                        actual_width, actual_height = _png_size(full_path)
                         file_size = os.path.getsize(full_path)
 
                         log("    [SAVED] {}x{} ({} bytes)".format(actual_width, actual_height, file_size))
@@ -556,11 +832,7 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
         log("[STEP 7] Restoring viewport...")
 
         # Return to restore view
-        restore_view_index = -1
-        for i in range(sc.doc.NamedViews.Count):
-            if sc.doc.NamedViews[i].Name == restore_view:
-                restore_view_index = i
-                break
+        restore_view_index = _find_named_view(sc.doc, restore_view)
 
         if restore_view_index >= 0:
             success = sc.doc.NamedViews.Restore(restore_view_index, active_view.ActiveViewport, True)
@@ -628,12 +900,8 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
         # Compile outputs
         main_status = "COMPLETE: {} saved, {} errors in {:.1f}s | Log: {} | {}".format(
             ok_count, err_count, total_time, log_file_path, "; ".join(status_msgs))
-        views_output = "\n".join(views_status)
-        capture_output = "\n".join(capture_status)
-        file_output = "\n".join(file_status)
-        debug_output = "\n".join(debug_msgs)
 
-        return main_status, directory_status, views_output, capture_output, file_output, debug_output
+        return _pack(main_status, directory_status)
 
     except Exception as main_error:
         log("")
@@ -642,11 +910,21 @@ def capture_views(trigger, view_names, size, mc_save_package, viewmode, restore_
         log("  " + str(main_error))
         log("=" * 70)
         log("Debug log saved to: " + log_file_path)
-        return "MAIN ERROR: {} | Log: {}".format(str(main_error), log_file_path), "", "", "", "", "\n".join(debug_msgs)
+        return _pack("MAIN ERROR: {} | Log: {}".format(str(main_error), log_file_path))
 
     finally:
-        # Close log file
-        if log_state['file']:
+        # Stop the writer, then write whatever it had not picked up yet on
+        # this thread so the tail of the log is never lost
+        if log_state['queue']:
+            log_state['stop'].set()
+            log_state['thread'].join()
+            tail = []
+            while True:
+                try:
+                    tail.append(log_state['queue'].get_nowait())
+                except queue.Empty:
+                    break
+            _write_log_lines(log_state['file'], tail)
             try:
                 log_state['file'].close()
             except:
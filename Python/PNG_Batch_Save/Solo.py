@@ -5,62 +5,121 @@
     import System
     import os
     import time
+    import random
 
     # OSC imports for sending messages to Processing
     import clr
     clr.AddReference("System")
     from System.Net import IPEndPoint, IPAddress
-    from System.Net.Sockets import UdpClient
+    from System.Net.Sockets import UdpClient, SocketException
     import struct
 
+    # Precompiled OSC argument packers
+    _PACK_I = struct.Struct('>i').pack
+    _PACK_F = struct.Struct('>f').pack
+
+    # Pause after /gh_shutter_trigger so the shutter sound lines up with the frame
+    SHUTTER_LEAD_IN = 0.1  # seconds
+
     # INPUTS: osc_string (string), restore_view (string)
     # OSC format: width,height,view_name,file_prefix,file_path,viewmode,transparent,file_midfix,file_suffix,file_series_number
     # Outputs: status, directory_check, views_found, capture_results, file_operations
 
+    def _png_size(path):
+        """Read (width, height) from a PNG's IHDR chunk without decoding the image"""
+        with open(path, 'rb') as f:
+            header = f.read(24)
+        if len(header) < 24 or header[:8] != b'\x89PNG\r\n\x1a\n':
+            raise ValueError("Not a valid PNG file: " + path)
+        return struct.unpack('>II', header[16:24])
+
+    def _get_udp_client(ip, port):
+        """
+        Return a UdpClient connected to ip:port, created on first use and
+        kept in sc.sticky so it survives across solves
+        """
+        clients = sc.sticky.setdefault('osc_udp_clients', {})
+        client = clients.get((ip, port))
+        if client is None:
+            client = UdpClient()
+            # Connect once so Send() needs no per-call endpoint
+            client.Connect(_get_endpoint(ip, port))
+            clients[(ip, port)] = client
+        return client
+
+    def _get_endpoint(ip, port):
+        """Return the IPEndPoint for ip:port, cached in sc.sticky across solves"""
+        endpoints = sc.sticky.setdefault('osc_endpoints', {})
+        endpoint = endpoints.get((ip, port))
+        if endpoint is None:
+            endpoint = endpoints[(ip, port)] = IPEndPoint(IPAddress.Parse(ip), port)
+        return endpoint
+
+    def _drop_udp_client(ip, port):
+        """Close and forget the UdpClient for ip:port so the next send rebuilds it"""
+        client = sc.sticky.setdefault('osc_udp_clients', {}).pop((ip, port), None)
+        if client is not None:
+            try:
+                client.Close()
+            except:
+                pass
+
+    def _osc_prefix(address, type_tag):
+        """Return the padded address + type tag bytes, cached in sc.sticky"""
+        prefixes = sc.sticky.setdefault('osc_prefixes', {})
+        prefix = prefixes.get((address, type_tag))
+        if prefix is None:
+            # Address string with null terminator, padded to multiple of 4
+            addr_bytes = (address + '\0').encode('utf-8')
+            addr_bytes += b'\0' * (-len(addr_bytes) & 3)
+            prefix = prefixes[(address, type_tag)] = addr_bytes + type_tag
+        return prefix
+
     def send_osc_message(address, value, ip="127.0.0.1", port=7010, retries=3):
         """Send OSC message to Processing with retry logic"""
         
-        # Build OSC message once
-        try:
-            # Address string with null terminator
-            addr_bytes = bytearray(address + '\0', 'utf-8')
-            # Pad to multiple of 4
-            while len(addr_bytes) % 4 != 0:
-                addr_bytes.append(0)
-            
-            # Type tag string (comma + type + null terminator)
-            if isinstance(value, int):
-                type_tag = bytearray(',i\0\0', 'utf-8')
-                # Pack integer as big-endian
-                value_bytes = bytearray(struct.pack('>i', value))
-            elif isinstance(value, float):
-                type_tag = bytearray(',f\0\0', 'utf-8')
-                # Pack float as big-endian
-                value_bytes = bytearray(struct.pack('>f', value))
-            else:
-                # String
-                type_tag = bytearray(',s\0\0', 'utf-8')
-                str_bytes = bytearray(str(value) + '\0', 'utf-8')
-                while len(str_bytes) % 4 != 0:
-                    str_bytes.append(0)
-                value_bytes = str_bytes
-            
-            # Combine all parts
-            message = bytes(addr_bytes + type_tag + value_bytes)
-            
-        except Exception as e:
-            print("OSC message build error: " + str(e))
-            return False
+        # Constant messages (e.g. /gh_shutter_trigger 1.0) are built once and
+        # reused as managed byte[] packets; the value type is part of the key so 1 and 1.0 stay distinct
+        packets = sc.sticky.setdefault('osc_packets', {})
+        key = (address, type(value), value)
+        message = packets.get(key)
         
-        # Try sending with retries
-        endpoint = IPEndPoint(IPAddress.Parse(ip), port)
+        if message is None:
+            try:
+                # Type tag string (comma + type + null terminator) and argument
+                if isinstance(value, int):
+                    # Pack integer as big-endian
+                    message = _osc_prefix(address, b',i\0\0') + _PACK_I(value)
+                elif isinstance(value, float):
+                    # Pack float as big-endian
+                    message = _osc_prefix(address, b',f\0\0') + _PACK_F(value)
+                else:
+                    # String, null terminated and padded to multiple of 4
+                    str_bytes = (str(value) + '\0').encode('utf-8')
+                    message = b''.join((_osc_prefix(address, b',s\0\0'), str_bytes,
+                                        b'\0' * (-len(str_bytes) & 3)))
+                
+                # Convert to a managed byte[] once; the cached array is handed
+                # to UdpClient.Send as-is instead of being marshaled per send
+                message = System.Array[System.Byte](message)
+                
+            except Exception as e:
+                print("OSC message build error: " + str(e))
+                return False
+            
+            # Variable payloads (elapsed times) would grow the cache without bound
+            if len(packets) >= 64:
+                packets.clear()
+            packets[key] = message
         
+        # Try sending with retries, reusing one connected client for every
+        # attempt; a transient failure just waits and sends again
+        client = None
         for attempt in range(retries):
             try:
-                # Create new UDP client for each attempt
-                client = UdpClient()
-                client.Send(message, len(message), endpoint)
-                client.Close()
+                if client is None:
+                    client = _get_udp_client(ip, port)
+                client.Send(message, message.Length)
                 
                 # Log success on retry
                 if attempt > 0:
@@ -69,9 +128,14 @@
                 return True
                 
             except Exception as e:
+                # Only a socket failure means the client itself is bad
+                if isinstance(e, SocketException):
+                    _drop_udp_client(ip, port)
+                    client = None
                 if attempt < retries - 1:
                     print("OSC send attempt {} failed: {}, retrying...".format(attempt + 1, str(e)))
-                    time.sleep(0.01)  # Small delay before retry
+                    # Full-jitter exponential backoff, capped at 200 ms
+                    time.sleep(random.uniform(0, min(0.2, 0.01 * (2 ** attempt))))
                 else:
                     print("OSC send error after {} attempts: ".format(retries) + str(e))
                     return False
@@ -173,15 +237,21 @@
                 sequence_num = int(file_series_number)
                 status_msgs.append("Using provided series number: {:03d}".format(sequence_num))
             else:
-                sequence_num = 1
-                while True:
-                    test_filename = "{}_{:03d}.png".format(base_name, sequence_num)
-                    test_path = os.path.join(file_path, test_filename)
-                    if not os.path.exists(test_path):
-                        break
-                    sequence_num += 1
-                    if sequence_num > 999:
-                        return "ERROR: Reached maximum sequence number (999)", "", "", "", ""
+                # One directory listing instead of an exists() probe per number;
+                # names compare case-insensitively, as on the Windows filesystem
+                prefix = (base_name + "_").lower()
+                name_len = len(prefix) + 7  # NNN.png
+                used = set()
+                for entry in os.listdir(file_path):
+                    entry = entry.lower()
+                    if len(entry) == name_len and entry.startswith(prefix) and entry.endswith(".png"):
+                        try:
+                            used.add(int(entry[len(prefix):len(prefix) + 3]))
+                        except ValueError:
+                            pass
+                sequence_num = next((i for i in range(1, 1000) if i not in used), None)
+                if sequence_num is None:
+                    return "ERROR: Reached maximum sequence number (999)", "", "", "", ""
                 status_msgs.append("Auto-selected next available series: {:03d}".format(sequence_num))
             status_msgs.append("Transparent background: " + str(transparent))
             status_msgs.append("Will restore to view: " + restore_view)
@@ -195,19 +265,31 @@
             viewport = active_view.ActiveViewport
             original_display_mode = viewport.DisplayMode
             
-            # Check available named views
-            total_named_views = sc.doc.NamedViews.Count
+            # Check available named views and index them by name once
+            # (first match wins, as with a linear scan)
+            named_views = sc.doc.NamedViews
+            total_named_views = named_views.Count
             status_msgs.append("Total named views: " + str(total_named_views))
-            
-            # Find requested display mode
-            target_mode = None
-            available_modes = []
-            for mode in Rhino.Display.DisplayModeDescription.GetDisplayModes():
-                available_modes.append(mode.EnglishName)
-                if mode.EnglishName.lower() == viewmode.lower():
-                    target_mode = mode
-            
-            status_msgs.append("Available display modes: " + ", ".join(available_modes))
+            named_view_index_by_name = {}
+            for i in range(total_named_views):
+                named_view_index_by_name.setdefault(named_views[i].Name, i)
+            
+            # Find requested display mode (name table cached across solves,
+            # refreshed only when the requested mode isn't in it)
+            cached_modes = sc.sticky.get("_display_modes_by_name")
+            target_mode = cached_modes[0].get(viewmode.lower()) if cached_modes else None
+            if target_mode is None:
+                modes_by_name = {}
+                available_modes = []
+                for mode in Rhino.Display.DisplayModeDescription.GetDisplayModes():
+                    available_modes.append(mode.EnglishName)
+                    # Last match wins, as with the original linear scan
+                    modes_by_name[mode.EnglishName.lower()] = mode
+                cached_modes = (modes_by_name, ", ".join(available_modes))
+                sc.sticky["_display_modes_by_name"] = cached_modes
+                target_mode = modes_by_name.get(viewmode.lower())
+            
+            status_msgs.append("Available display modes: " + cached_modes[1])
             
             if target_mode:
                 viewport.DisplayMode = target_mode
@@ -219,15 +301,9 @@
             capture_status.append("=== PROCESSING VIEW ===")
             capture_status.append("View: {}, Width: {}, Height: {}".format(view_name, width, height))
             
-            view_found = False
-            named_view_index = -1
-            
-            # Search for named view
-            for i in range(sc.doc.NamedViews.Count):
-                if sc.doc.NamedViews[i].Name == view_name:
-                    named_view_index = i
-                    view_found = True
-                    break
+            # Look up named view
+            named_view_index = named_view_index_by_name.get(view_name, -1)
+            view_found = named_view_index >= 0
             
             if view_found:
                 views_status.append("FOUND: {} at index {} - resolution {}x{}".format(
@@ -235,7 +311,7 @@
                 
                 try:
                     # Restore the named view
-                    success = sc.doc.NamedViews.Restore(named_view_index, active_view.ActiveViewport, True)
+                    success = named_views.Restore(named_view_index, active_view.ActiveViewport, True)
                     
                     if success:
                         capture_status.append("Named view restored successfully: " + view_name)
@@ -251,11 +327,10 @@
                         capture_status.append("Target file: " + filename)
                         capture_status.append("USING DIMENSIONS: {}x{} for {}".format(width, height, view_name))
                         
-                        # Force redraw to update viewport
-                        sc.doc.Views.Redraw()
-                        
-                        # Small delay to ensure view is updated
-                        time.sleep(0.3)
+                        # Redraw the capture view and let Rhino process the
+                        # pending paint before capturing
+                        active_view.Redraw()
+                        Rhino.RhinoApp.Wait()
                         
                         # **** SEND OSC MESSAGE TO PLAY SHUTTER SOUND ****
                         osc_sent = send_osc_message("/gh_shutter_trigger", 1.0)
@@ -263,41 +338,50 @@
                             capture_status.append("Sent shutter sound trigger to Processing")
                         
                         # Small delay for audio to start
-                        time.sleep(0.1)
+                        time.sleep(SHUTTER_LEAD_IN)
                         
                         # Capture using appropriate method
                         try:
                             if transparent:
-                                # CORRECTED: Options BEFORE filename
-                                command_string = '-ViewCaptureToFile Width={} Height={} TransparentBackground=Yes "{}"'.format(
-                                width, height, full_path)
+                                # Capture in-process (same result as -ViewCaptureToFile
+                                # TransparentBackground=Yes, without the command round-trip)
+                                view_capture = Rhino.Display.ViewCapture()
+                                view_capture.Width = width
+                                view_capture.Height = height
+                                view_capture.TransparentBackground = True
+                                view_capture.ScaleScreenItems = False
+                                view_capture.DrawGrid = False
+                                view_capture.DrawAxes = False
+                                view_capture.DrawGridAxes = False
                                 
-                                capture_status.append("COMMAND STRING: " + command_string)
-                                command_success = Rhino.RhinoApp.RunScript(command_string, False)
+                                capture_status.append("CAPTURE: ViewCapture {}x{} transparent".format(width, height))
+                                bitmap = view_capture.CaptureToBitmap(active_view)
                                 
-                                if command_success:
-                                    time.sleep(0.5)
-                                    if os.path.exists(full_path):
-                                        # Check actual dimensions of saved file
-                                        saved_image = Drawing.Image.FromFile(full_path)
-                                        actual_width = saved_image.Width
-                                        actual_height = saved_image.Height
-                                        saved_image.Dispose()
-                                        
-                                        file_size = os.path.getsize(full_path)
-                                        file_status.append("SAVED: {} | Expected: {}x{} | Actual: {}x{} | Size: {} bytes".format(
-                                            filename, width, height, actual_width, actual_height, file_size))
-                                    else:
-                                        capture_status.append("ERROR: Transparent capture - file not found")
+                                if bitmap:
+                                    # Release the GDI+ bitmap even if the save fails
+                                    try:
+                                        bitmap.Save(full_path, Imaging.ImageFormat.Png)
+                                    finally:
+                                        bitmap.Dispose()
+                                    
+                                    # Save is synchronous; check actual dimensions from the PNG header
+                                    actual_width, actual_height = _png_size(full_path)
+                                    
+                                    file_size = os.path.getsize(full_path)
+                                    file_status.append("SAVED: {} | Expected: {}x{} | Actual: {}x{} | Size: {} bytes".format(
+                                        filename, width, height, actual_width, actual_height, file_size))
                                 else:
-                                    capture_status.append("ERROR: ViewCaptureToFile command failed")
+                                    capture_status.append("ERROR: ViewCapture failed for " + view_name)
                             else:
                                 # Non-transparent: use CaptureToBitmap directly
                                 bitmap = active_view.CaptureToBitmap(Drawing.Size(width, height))
                                 if bitmap:
-                                    capture_status.append("Bitmap captured: {}x{}".format(bitmap.Width, bitmap.Height))
-                                    bitmap.Save(full_path, Imaging.ImageFormat.Png)
-                                    bitmap.Dispose()
+                                    # Release the GDI+ bitmap even if the save fails
+                                    try:
+                                        capture_status.append("Bitmap captured: {}x{}".format(bitmap.Width, bitmap.Height))
+                                        bitmap.Save(full_path, Imaging.ImageFormat.Png)
+                                    finally:
+                                        bitmap.Dispose()
                                     
                                     file_size = os.path.getsize(full_path)
                                     file_status.append("SAVED: " + filename + " (" + str(file_size) + " bytes)")
@@ -316,14 +400,10 @@
                 views_status.append("NOT FOUND: " + view_name)
             
             # Return viewport to restore view
-            restore_view_index = -1
-            for i in range(sc.doc.NamedViews.Count):
-                if sc.doc.NamedViews[i].Name == restore_view:
-                    restore_view_index = i
-                    break
+            restore_view_index = named_view_index_by_name.get(restore_view, -1)
             
             if restore_view_index >= 0:
-                success = sc.doc.NamedViews.Restore(restore_view_index, active_view.ActiveViewport, True)
+                success = named_views.Restore(restore_view_index, active_view.ActiveViewport, True)
                 if success:
                     status_msgs.append("Viewport returned to: " + restore_view)
                 else:
@@ -1,6 +1,7 @@
 import scriptcontext as sc
 import datetime
 import os
+import atexit
 
 """
 GRASSHOPPER STATE MONITOR COMPONENT
@@ -19,23 +20,75 @@ OUTPUTS:
 - log_path: Path to the log file
 """
 
+# Log writes go through one cached handle per component. State changes are
+# rare, so each entry is flushed as it is written and stays visible to a tail.
+def _close_handles(handles):
+    """Close every cached log handle at interpreter exit"""
+    for f in handles:
+        try:
+            f.close()
+        except (OSError, ValueError):
+            pass
+
+# Handles opened by any StateMonitor instance; the list lives in sc.sticky so
+# the atexit close is registered only once per session
+_OPEN_HANDLES = sc.sticky.get("state_monitor_handles")
+if _OPEN_HANDLES is None:
+    _OPEN_HANDLES = sc.sticky["state_monitor_handles"] = []
+    atexit.register(_close_handles, _OPEN_HANDLES)
+
+def _timestamp():
+    """Current local time as YYYY-MM-DD HH:MM:SS.mmm"""
+    now = datetime.datetime.now()
+    return "%04d-%02d-%02d %02d:%02d:%02d.%03d" % (
+        now.year, now.month, now.day, now.hour, now.minute, now.second,
+        now.microsecond // 1000)
+
+def _drop_handle(fh_key):
+    """Close this component's cached log handle and forget it"""
+    state = sc.sticky.pop(fh_key, None)
+    if state is None:
+        return
+    if state['file'] in _OPEN_HANDLES:
+        _OPEN_HANDLES.remove(state['file'])
+    try:
+        state['file'].close()
+    except (OSError, ValueError):
+        pass
+
+def _write_log(fh_key, log_file_path, text):
+    """
+    Append text to the log through a handle cached in sc.sticky
+
+    Falls back to a one-off open/append if the cached handle can't be
+    opened or written (e.g. the drive went away). A failed flush after a
+    successful write only drops the handle, so the entry is not repeated.
+    """
+    written = False
+    try:
+        state = sc.sticky.get(fh_key)
+        if state is None or state['path'] != log_file_path:
+            _drop_handle(fh_key)
+            f = open(log_file_path, 'a')
+            _OPEN_HANDLES.append(f)
+            state = sc.sticky[fh_key] = {'file': f, 'path': log_file_path}
+        state['file'].write(text)
+        written = True
+        state['file'].flush()
+    except (OSError, ValueError):
+        _drop_handle(fh_key)
+        if not written:
+            with open(log_file_path, 'a') as f:
+                f.write(text)
+
 def monitor_state(mc_save_trigger, mc_saturation):
     """
     Monitor state changes and append to log file
     """
 
-    # Setup log file path
-    log_dir = "x:\\Shaw\\Helmets\\November\\Grasshopper\\Python\\PNG_Batch_Save\\logs"
-    if not os.path.exists(log_dir):
-        try:
-            os.makedirs(log_dir)
-        except:
-            log_dir = "C:\\Temp"
-
-    log_file_path = os.path.join(log_dir, "state_monitor.txt")
-
-    # Create sticky key for this component instance
+    # Create sticky keys for this component instance
     sticky_key = "state_monitor_" + str(ghenv.Component.InstanceGuid)
+    fh_key = "state_monitor_fh_" + str(ghenv.Component.InstanceGuid)
 
     # Get previous values from sticky
     last_state = sc.sticky.get(sticky_key, None)
@@ -44,65 +97,82 @@ def monitor_state(mc_save_trigger, mc_saturation):
     current_trigger = mc_save_trigger if mc_save_trigger is not None else 0.0
     current_saturation = mc_saturation if mc_saturation is not None else 0.0
 
-    # Check if this is first run or if values have changed
+    # Fast path: most solves are triggered by unrelated inputs, so return the
+    # status prepared at the last change without touching the disk
+    if (last_state is not None and 'unchanged_status' in last_state and
+            last_state['trigger'] == current_trigger and
+            last_state['saturation'] == current_saturation):
+        return last_state['unchanged_status'], last_state['log_file_path']
+
+    # Setup log file path
+    log_dir = "x:\\Shaw\\Helmets\\November\\Grasshopper\\Python\\PNG_Batch_Save\\logs"
+    try:
+        os.makedirs(log_dir, exist_ok=True)
+    except OSError:
+        log_dir = "C:\\Temp"
+
+    log_file_path = os.path.join(log_dir, "state_monitor.txt")
+
+    # Sticky state for this component; the no-change status is formatted
+    # here, once per change, rather than on every solve
+    new_state = {
+        'trigger': current_trigger,
+        'saturation': current_saturation,
+        'log_file_path': log_file_path,
+        'unchanged_status': "No change | trigger={} | saturation={}".format(
+            current_trigger, current_saturation)
+    }
+
+    # Check if this is first run (otherwise the values have changed)
     if last_state is None:
         # First run - initialize
-        sc.sticky[sticky_key] = {
-            'trigger': current_trigger,
-            'saturation': current_saturation
-        }
+        sc.sticky[sticky_key] = new_state
 
         # Write initial state to log
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+        timestamp = _timestamp()
         try:
-            with open(log_file_path, 'a') as f:
-                f.write("=" * 70 + "\n")
-                f.write("STATE MONITOR INITIALIZED: {}\n".format(timestamp))
-                f.write("  mc_save_trigger = {}\n".format(current_trigger))
-                f.write("  mc_saturation   = {}\n".format(current_saturation))
-                f.write("-" * 70 + "\n")
+            _write_log(fh_key, log_file_path,
+                       "=" * 70 + "\n" +
+                       "STATE MONITOR INITIALIZED: {}\n".format(timestamp) +
+                       "  mc_save_trigger = {}\n".format(current_trigger) +
+                       "  mc_saturation   = {}\n".format(current_saturation) +
+                       "-" * 70 + "\n")
         except Exception as e:
             return "ERROR: Could not write to log: {}".format(str(e)), log_file_path
 
         status = "Initialized | trigger={} | saturation={}".format(current_trigger, current_saturation)
         return status, log_file_path
 
-    # Check for changes
+    # State changed - log it
     trigger_changed = (last_state['trigger'] != current_trigger)
     saturation_changed = (last_state['saturation'] != current_saturation)
-
-    if trigger_changed or saturation_changed:
-        # State changed - log it
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-
-        try:
-            with open(log_file_path, 'a') as f:
-                f.write("{} | ".format(timestamp))
-
-                if trigger_changed and saturation_changed:
-                    f.write("BOTH CHANGED | trigger: {} -> {} | saturation: {} -> {}\n".format(
-                        last_state['trigger'], current_trigger,
-                        last_state['saturation'], current_saturation))
-                elif trigger_changed:
-                    f.write("TRIGGER CHANGED | {} -> {} | saturation: {}\n".format(
-                        last_state['trigger'], current_trigger, current_saturation))
-                else:  # saturation_changed
-                    f.write("SATURATION CHANGED | {} -> {} | trigger: {}\n".format(
-                        last_state['saturation'], current_saturation, current_trigger))
-        except Exception as e:
-            return "ERROR: Could not write to log: {}".format(str(e)), log_file_path
-
-        # Update sticky
-        sc.sticky[sticky_key] = {
-            'trigger': current_trigger,
-            'saturation': current_saturation
-        }
-
-        status = "CHANGED | trigger={} | saturation={}".format(current_trigger, current_saturation)
-    else:
-        # No change
-        status = "No change | trigger={} | saturation={}".format(current_trigger, current_saturation)
-
+    if not (trigger_changed or saturation_changed):
+        # Unchanged, but stored by an older version without the prepared status
+        sc.sticky[sticky_key] = new_state
+        return new_state['unchanged_status'], log_file_path
+
+    timestamp = _timestamp()
+
+    if trigger_changed and saturation_changed:
+        entry = "BOTH CHANGED | trigger: {} -> {} | saturation: {} -> {}\n".format(
+            last_state['trigger'], current_trigger,
+            last_state['saturation'], current_saturation)
+    elif trigger_changed:
+        entry = "TRIGGER CHANGED | {} -> {} | saturation: {}\n".format(
+            last_state['trigger'], current_trigger, current_saturation)
+    else:  # saturation_changed
+        entry = "SATURATION CHANGED | {} -> {} | trigger: {}\n".format(
+            last_state['saturation'], current_saturation, current_trigger)
+
+    try:
+        _write_log(fh_key, log_file_path, "{} | ".format(timestamp) + entry)
+    except Exception as e:
+        return "ERROR: Could not write to log: {}".format(str(e)), log_file_path
+
+    # Update sticky
+    sc.sticky[sticky_key] = new_state
+
+    status = "CHANGED | trigger={} | saturation={}".format(current_trigger, current_saturation)
     return status, log_file_path
 
 # ============================================================================
@@ -47,13 +47,51 @@ Component Outputs:
 
 import Rhino.Geometry as rg
 import Rhino
+import System
 import math
+from operator import attrgetter
 import scriptcontext as sc
 
+# Set to False to drop the DEBUG lines from the warnings output (and skip
+# formatting them and the work done only for them); ERROR/WARNING lines are
+# always reported. On by default, which keeps the full DEBUG output; the
+# gating only saves time once this is switched off.
+DEBUG_ENABLED = True
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+def cross_unit(a, b):
+    """
+    Unit cross product a x b, computed in plain floats.
+    Returns a zero vector if a and b are parallel (as Unitize leaves it).
+    """
+    ax, ay, az = a.X, a.Y, a.Z
+    bx, by, bz = b.X, b.Y, b.Z
+    cx = ay * bz - az * by
+    cy = az * bx - ax * bz
+    cz = ax * by - ay * bx
+    length = math.sqrt(cx * cx + cy * cy + cz * cz)
+    if length < 1e-12:
+        return rg.Vector3d(cx, cy, cz)
+    return rg.Vector3d(cx / length, cy / length, cz / length)
+
+
+def surface_content_key(srf):
+    """
+    Hashable key for a NURBS surface's full definition (degrees, knots and
+    weighted control points). Equal keys mean identical geometry.
+    """
+    key = [srf.Degree(0), srf.Degree(1), srf.Points.CountU, srf.Points.CountV]
+    key.extend(srf.KnotsU)
+    key.extend(srf.KnotsV)
+    for cv in srf.Points:
+        loc = cv.Location
+        key.extend((loc.X, loc.Y, loc.Z, cv.Weight))
+    return tuple(key)
+
+
 def extract_trim_curve(brep_surface):
     """
     Extract the outermost trim curve from a trimmed BrepFace.
@@ -65,68 +103,115 @@ def extract_trim_curve(brep_surface):
     face = brep_surface.Faces[0]
 
     # Get the outer loop
-    loops = face.Loops
-    outer_loop = None
+    outer_loop = face.OuterLoop
+    if outer_loop:
+        return outer_loop.To3dCurve()
 
-    for loop in loops:
-        if loop.LoopType == rg.BrepLoopType.Outer:
-            outer_loop = loop
-            break
+    # Fallback: find longest loop. Rank by bounding-box diagonal (cheap) and
+    # only measure arc length for the two largest candidates.
+    candidates = []
+    for loop in face.Loops:
+        crv = loop.To3dCurve()
+        if crv:
+            candidates.append((crv.GetBoundingBox(True).Diagonal.Length, crv))
+
+    if not candidates:
+        return None
 
-    if not outer_loop:
-        # Fallback: find longest loop
-        max_length = 0
-        for loop in loops:
-            crv = loop.To3dCurve()
-            if crv and crv.GetLength() > max_length:
-                max_length = crv.GetLength()
-                outer_loop = loop
+    candidates.sort(key=lambda c: c[0], reverse=True)
+    return max((crv for _, crv in candidates[:2]), key=lambda crv: crv.GetLength())
 
-    if outer_loop:
-        trim_curve = outer_loop.To3dCurve()
-        return trim_curve
 
-    return None
+def _bisect_yz_crossing(curve, ta, xa, tb, tol, max_iter=60):
+    """
+    Bisect a parameter bracket [ta, tb] whose end points lie on opposite
+    sides of the YZ plane (xa is the X at ta). Returns (point, param).
+    """
+    for _ in range(max_iter):
+        tm = 0.5 * (ta + tb)
+        pt = curve.PointAt(tm)
+        xm = pt.X
+        if abs(xm) <= tol or tb - ta <= 1e-12:
+            return pt, tm
+        if (xm < 0.0) == (xa < 0.0):
+            ta, xa = tm, xm
+        else:
+            tb = tm
+    return pt, tm
 
 
-def find_yz_plane_intersections(curve):
+def find_yz_plane_intersections(curve, tol=None):
     """
     Find intersection points of curve with YZ plane (X=0).
     Entry point = most POSITIVE Y (at X=0)
     Exit point = most NEGATIVE Y (at X=0)
     Returns dict with 'entry' and 'exit' points and parameters.
+    tol defaults to the document tolerance when not passed in.
     """
     if not curve:
         return None
 
+    if tol is None:
+        tol = sc.doc.ModelAbsoluteTolerance
+
     # Create YZ plane at X=0
     plane = rg.Plane(rg.Point3d(0, 0, 0), rg.Vector3d(1, 0, 0))
 
     # Find all intersection points
-    intersections = rg.Intersect.Intersection.CurvePlane(curve, plane, sc.doc.ModelAbsoluteTolerance)
+    intersections = rg.Intersect.Intersection.CurvePlane(curve, plane, tol)
 
     if not intersections or len(intersections) == 0:
         # Fallback: find points closest to YZ plane (X=0)
-        t_list = []
-        for i in range(0, 360, 10):
-            t = curve.Domain.ParameterAt(i / 360.0)
-            t_list.append(t)
-
-        points = [curve.PointAt(t) for t in t_list]
-
-        # Filter to points closest to X=0
+        # Single pass tracking the extreme-Y samples instead of building and
+        # sorting lists; kept both for points near X=0 and for all points
+        # Domain.ParameterAt is a plain affine map; compute it locally
+        domain = curve.Domain
+        t0 = domain.T0
+        dt = (domain.T1 - t0) / 360.0
         x_threshold = 1.0  # Within 1 unit of YZ plane
-        yz_points = [(pt, t) for pt, t in zip(points, t_list) if abs(pt.X) < x_threshold]
-
-        if len(yz_points) < 2:
+        near = [None, None, 0]  # [entry (pt, t), exit (pt, t), count]
+        every = [None, None, 0]
+        brackets = []  # (t_a, x_a, t_b) where X changes sign
+        prev = None
+        for i in range(0, 360, 10):
+            t = t0 + dt * i
+            pt = curve.PointAt(t)
+            y = pt.Y
+            if prev is None:
+                first_x = pt.X
+            elif (pt.X < 0.0) != (prev[1] < 0.0):
+                brackets.append((prev[0], prev[1], t))
+            prev = (t, pt.X)
+            for best in ((near, every) if abs(pt.X) < x_threshold else (every,)):
+                # Ties: last sample wins for entry, first for exit (stable sort order)
+                if best[0] is None or y >= best[0][0].Y:
+                    best[0] = (pt, t)
+                if best[1] is None or y < best[1][0].Y:
+                    best[1] = (pt, t)
+                best[2] += 1
+
+        # Closing segment of a closed curve (last sample back to the start)
+        if curve.IsClosed and (prev[1] < 0.0) != (first_x < 0.0):
+            brackets.append((prev[0], prev[1], domain.T1))
+
+        # Sign changes bracket real crossings the intersector missed; refine
+        # those to X=0 rather than settling for the nearest sample. A single
+        # bracket (open or partial rail) would give entry == exit, so that
+        # case keeps the extreme-sample pair below.
+        if len(brackets) >= 2:
+            crossings = [_bisect_yz_crossing(curve, ta, xa, tb, tol) for ta, xa, tb in brackets]
+            crossings.sort(key=lambda c: c[0].Y)
+            return {
+                'entry': {'point': crossings[-1][0], 'param': crossings[-1][1]},
+                'exit': {'point': crossings[0][0], 'param': crossings[0][1]}
+            }
+
+        if near[2] < 2:
             # Use all points if we can't find enough near YZ plane
-            yz_points = list(zip(points, t_list))
+            near = every
 
-        # Sort by Y coordinate
-        yz_points.sort(key=lambda p: p[0].Y)
-
-        entry_pt, entry_t = yz_points[-1]   # Most +Y (FLIPPED)
-        exit_pt, exit_t = yz_points[0]      # Most -Y (FLIPPED)
+        entry_pt, entry_t = near[0]   # Most +Y (FLIPPED)
+        exit_pt, exit_t = near[1]     # Most -Y (FLIPPED)
 
         return {
             'entry': {'point': entry_pt, 'param': entry_t},
@@ -154,6 +239,27 @@ def find_yz_plane_intersections(curve):
     }
 
 
+def remap_yz_intersections(curve, intersections, param_map, tol=None):
+    """
+    Carry find_yz_plane_intersections results over to a curve whose
+    parameterization changed by a known map (seam move, reparameterize,
+    reverse) instead of intersecting again.
+    Each mapped param is checked against the stored point; returns None if
+    any is off, in which case the caller should intersect again.
+    tol (document tolerance if not passed in) is widened 10x for the check.
+    """
+    if tol is None:
+        tol = sc.doc.ModelAbsoluteTolerance
+    tol10 = tol * 10
+    remapped = {}
+    for key, hit in intersections.items():
+        t = param_map(hit['param'])
+        if curve.PointAt(t).DistanceTo(hit['point']) > tol10:
+            return None
+        remapped[key] = {'point': hit['point'], 'param': t}
+    return remapped
+
+
 def reorder_curve_to_start(curve, start_param):
     """
     Reorder a periodic curve to start at the specified parameter.
@@ -166,6 +272,11 @@ def reorder_curve_to_start(curve, start_param):
     if not curve.IsClosed:
         return curve
 
+    # Already starts there: no copy or seam change needed
+    current_start = curve.Domain.T0
+    if abs(start_param - current_start) < 1e-9 * max(1.0, abs(current_start)):
+        return curve
+
     # Change the seam to start at the specified parameter
     new_curve = curve.DuplicateCurve()
 
@@ -178,54 +289,104 @@ def reorder_curve_to_start(curve, start_param):
         return curve
 
 
-def get_perpendicular_to_trim(surface, edge_curve, param):
+def sample_trim_frame(face, edge_curve, param, normal_cache=None, pt=None):
     """
-    Get vector perpendicular to trim edge, tangent to surface, pointing outward.
-    Uses robust inward detection, then reverses for outward.
+    Evaluate the trim edge and surface once at a rail parameter.
+    Returns (point, curve_tangent, u, v, surface_normal), or None if the
+    point can't be projected to the face. Callers share this frame so the
+    edge/surface evaluations aren't repeated per control point.
+
+    normal_cache: optional dict (one per face) of (u, v) -> normal, so
+    control points that project to the same surface location (e.g. the
+    entry and closure sections) evaluate NormalAt only once.
+    pt: the edge point at param, if the caller has already evaluated it.
     """
-    face = surface.Faces[0]
-
-    # Get point and curve tangent
-    pt = edge_curve.PointAt(param)
+    if pt is None:
+        pt = edge_curve.PointAt(param)
     crv_tangent = edge_curve.TangentAt(param)
 
-    # Get surface normal
     success, u, v = face.ClosestPoint(pt)
     if not success:
         return None
 
-    srf_normal = face.NormalAt(u, v)
+    if normal_cache is None:
+        return (pt, crv_tangent, u, v, face.NormalAt(u, v))
 
-    # Calculate perpendicular vector (tangent to surface, perpendicular to edge)
-    perp_vec = rg.Vector3d.CrossProduct(srf_normal, crv_tangent)
-    perp_vec.Unitize()
+    normal = normal_cache.get((u, v))
+    if normal is None:
+        normal = normal_cache[(u, v)] = face.NormalAt(u, v)
+    return (pt, crv_tangent, u, v, rg.Vector3d(normal))
 
-    # Robust inward detection (multiple test points)
-    tol = sc.doc.ModelAbsoluteTolerance
-    test_distances = [tol * 10, tol * 50, tol * 100]
-    interior_count = 0
-    exterior_count = 0
 
-    for test_dist in test_distances:
-        test_pt_3d = pt + (perp_vec * test_dist)
-        success, test_u, test_v = face.ClosestPoint(test_pt_3d)
+def get_perpendicular_to_trim(surface, edge_curve, param, frame=None, srf_center=None,
+                              relation_cache=None, tol=None):
+    """
+    Get vector perpendicular to trim edge, tangent to surface, pointing outward.
+    Uses robust inward detection, then reverses for outward.
 
-        if success:
-            relation = face.IsPointOnFace(test_u, test_v)
+    frame (from sample_trim_frame) may be passed in when the caller already has it.
+    srf_center (face bounding-box center) may be passed in by callers that
+    process many params on the same face.
+    relation_cache: optional dict (one per face) of (u, v) -> PointFaceRelation
+    shared across calls, so repeated probes skip IsPointOnFace.
+    tol: document tolerance, passed in by callers that already read it.
+    """
+    face = surface.Faces[0]
 
-            if relation == rg.PointFaceRelation.Interior:
-                interior_count += 1
-            elif relation == rg.PointFaceRelation.Exterior:
-                exterior_count += 1
+    # Get point, curve tangent and surface normal
+    if frame is None:
+        frame = sample_trim_frame(face, edge_curve, param)
+        if frame is None:
+            return None
 
-    # Additional validation: check alignment with surface center
-    srf_center = face.GetBoundingBox(True).Center
+    pt, crv_tangent, u, v, srf_normal = frame
+
+    # Calculate perpendicular vector (tangent to surface, perpendicular to edge)
+    perp_vec = cross_unit(srf_normal, crv_tangent)
+
+    # Check alignment with surface center (doesn't depend on the probes)
+    if srf_center is None:
+        srf_center = face.GetBoundingBox(True).Center
     to_center = srf_center - pt
     to_center_proj = to_center - (to_center * srf_normal) * srf_normal
     to_center_proj.Unitize()
 
     alignment_with_center = rg.Vector3d.Multiply(perp_vec, to_center_proj)
 
+    # Inward detection: probe the middle distance first. If it agrees with the
+    # center alignment the answer is unambiguous; otherwise probe all three.
+    if tol is None:
+        tol = sc.doc.ModelAbsoluteTolerance
+    interior = rg.PointFaceRelation.Interior
+    exterior = rg.PointFaceRelation.Exterior
+    interior_count = 0
+    exterior_count = 0
+
+    def probe(test_dist):
+        test_pt_3d = pt + (perp_vec * test_dist)
+        success, test_u, test_v = face.ClosestPoint(test_pt_3d)
+        if not success:
+            return None
+        if relation_cache is None:
+            return face.IsPointOnFace(test_u, test_v)
+        relation = relation_cache.get((test_u, test_v))
+        if relation is None:
+            relation = relation_cache[(test_u, test_v)] = face.IsPointOnFace(test_u, test_v)
+        return relation
+
+    relation = probe(tol * 50)
+    if relation == interior and alignment_with_center > 0:
+        interior_count = 1
+    elif relation == exterior and alignment_with_center < 0:
+        exterior_count = 1
+    else:
+        # Ambiguous: robust inward detection (multiple test points)
+        for relation in (probe(tol * 10), relation, probe(tol * 100)):
+            if relation == interior:
+                interior_count += 1
+            elif relation == exterior:
+                exterior_count += 1
+
     # Decision logic
     if exterior_count > interior_count:
         perp_vec.Reverse()
@@ -250,26 +411,40 @@ def get_curve_normal(curve, param):
         arbitrary = rg.Vector3d(0, 0, 1)
         if abs(tangent * arbitrary) > 0.9:
             arbitrary = rg.Vector3d(0, 1, 0)
-        normal = rg.Vector3d.CrossProduct(tangent, arbitrary)
-        normal.Unitize()
-        return normal
+        return cross_unit(tangent, arbitrary)
 
     # Binormal is perpendicular to both tangent and curvature
-    binormal = rg.Vector3d.CrossProduct(tangent, curvature)
-    binormal.Unitize()
-    return binormal
+    return cross_unit(tangent, curvature)
 
 
 def rotate_vector(vector, angle_degrees, axis):
     """
     Rotate a vector around an axis by specified angle in degrees.
+    Closed-form Rodrigues rotation (same result as Transform.Rotation about
+    the origin) without building a 4x4 transform per call.
     """
+    length = axis.Length
+    if length < 1e-12:
+        return rg.Vector3d(vector)
+
     angle_radians = math.radians(angle_degrees)
-    rotation = rg.Transform.Rotation(angle_radians, axis, rg.Point3d.Origin)
+    cos_a = math.cos(angle_radians)
+    sin_a = math.sin(angle_radians)
+
+    # Unit axis k
+    kx = axis.X / length
+    ky = axis.Y / length
+    kz = axis.Z / length
+    vx = vector.X
+    vy = vector.Y
+    vz = vector.Z
 
-    rotated = rg.Vector3d(vector)
-    rotated.Transform(rotation)
-    return rotated
+    # v' = v cos + (k x v) sin + k (k . v)(1 - cos)
+    k_dot_v = (kx * vx + ky * vy + kz * vz) * (1.0 - cos_a)
+    return rg.Vector3d(
+        vx * cos_a + (ky * vz - kz * vy) * sin_a + kx * k_dot_v,
+        vy * cos_a + (kz * vx - kx * vz) * sin_a + ky * k_dot_v,
+        vz * cos_a + (kx * vy - ky * vx) * sin_a + kz * k_dot_v)
 
 
 def rotate_vector_yz(vector, angle_degrees):
@@ -298,13 +473,22 @@ def rotate_vector_yz(vector, angle_degrees):
     return rg.Vector3d(x, y_new, z_new)
 
 
-def create_cubic_bezier(P0, P1, P2, P3):
+def create_cubic_bezier(P0, P1, P2, P3, buffer=None):
     """
     Create a cubic Bezier curve from 4 control points.
+    A clamped degree-3 NURBS with 4 control points is the Bezier itself, so
+    build it directly rather than via BezierCurve.ToNurbsCurve.
+
+    buffer: optional reusable Point3d[4] array for callers building many
+    sections (NurbsCurve.Create copies the points, so it can be overwritten).
     """
-    bezier = rg.BezierCurve([P0, P1, P2, P3])
-    nurbs_curve = bezier.ToNurbsCurve()
-    return nurbs_curve
+    if buffer is None:
+        buffer = System.Array.CreateInstance(rg.Point3d, 4)
+    buffer[0] = P0
+    buffer[1] = P1
+    buffer[2] = P2
+    buffer[3] = P3
+    return rg.NurbsCurve.Create(False, 3, buffer)
 
 
 def create_quadratic_bezier(P0, P1, P2):
@@ -430,25 +614,48 @@ def create_cilia_curve(surface_point, surface_normal, inboard_tangent,
     return rg.Line(surface_point, end_point).ToNurbsCurve()
 
 
-def interpolate_value(val_start, val_end, t, bias=0.5):
+def bias_weight(t, bias=0.5):
     """
-    Interpolate between two values with bias curve.
-
-    bias = 0.0: maintains source value longer, sharp transition near target
-    bias = 0.5: symmetric/linear transition
-    bias = 1.0: releases source early, maintains target longer
+    Bias curve weight (0.0-1.0) at interpolation parameter t.
+    Depends only on t and bias, so it can be shared by every value
+    interpolated at the same t.
     """
     if bias < 0.5:
         # Favor source
-        weight = pow(t, 1.0 / (2.0 * bias + 0.01))
+        return pow(t, 1.0 / (2.0 * bias + 0.01))
     elif bias > 0.5:
         # Favor target
-        weight = 1.0 - pow(1.0 - t, 1.0 / (2.0 * (1.0 - bias) + 0.01))
+        return 1.0 - pow(1.0 - t, 1.0 / (2.0 * (1.0 - bias) + 0.01))
     else:
         # Linear
-        weight = t
+        return t
+
 
-    return val_start + (val_end - val_start) * weight
+def make_bias_weight(bias=0.5):
+    """
+    Return a bias_weight(t) specialized for a fixed bias.
+    The branch and exponent are resolved once, so loops that interpolate
+    many t values with the same bias skip them per call.
+    """
+    if bias < 0.5:
+        k = 1.0 / (2.0 * bias + 0.01)
+        return lambda t: pow(t, k)
+    elif bias > 0.5:
+        k = 1.0 / (2.0 * (1.0 - bias) + 0.01)
+        return lambda t: 1.0 - pow(1.0 - t, k)
+    else:
+        return lambda t: t
+
+
+def interpolate_value(val_start, val_end, t, bias=0.5):
+    """
+    Interpolate between two values with bias curve.
+
+    bias = 0.0: maintains source value longer, sharp transition near target
+    bias = 0.5: symmetric/linear transition
+    bias = 1.0: releases source early, maintains target longer
+    """
+    return val_start + (val_end - val_start) * bias_weight(t, bias)
 
 
 # ============================================================================
@@ -458,6 +665,11 @@ def interpolate_value(val_start, val_end, t, bias=0.5):
 class ControlPointDefinition:
     """Defines a control point location and its properties."""
 
+    # Fixed attribute set: compact instances and faster attribute access
+    # in the per-control-point loops
+    __slots__ = ('name', 'param', 'angle_dome', 'angle_bowl', 'mag_dome', 'mag_bowl',
+                 'dome_point', 'bowl_point', 'dome_vector', 'bowl_vector')
+
     def __init__(self, name, param, angle_dome, angle_bowl, mag_dome, mag_bowl):
         self.name = name
         self.param = param  # 0.0 to 1.0 around the perimeter
@@ -471,6 +683,10 @@ class ControlPointDefinition:
         self.bowl_vector = None
 
 
+# Sort key for control point lists
+_by_param = attrgetter('param')
+
+
 def build_primary_control_points(exit_param, A_position, B_position, include_A, include_B,
                                    entry_angle_dome, entry_angle_bowl, entry_mag_dome, entry_mag_bowl,
                                    A_angle_dome, A_angle_bowl, A_mag_dome, A_mag_bowl,
@@ -531,7 +747,7 @@ def build_primary_control_points(exit_param, A_position, B_position, include_A,
         ))
 
     # Sort by param to ensure correct order
-    control_points.sort(key=lambda cp: cp.param)
+    control_points.sort(key=_by_param)
 
     return control_points
 
@@ -551,6 +767,9 @@ def build_intermediate_control_points(cp1, cp2, num_intermediates, bias, reverse
 
     Returns list of ControlPointDefinition objects (does NOT include cp1 or cp2).
     """
+    if num_intermediates <= 0:
+        return []
+
     intermediates = []
 
     # Check if we're wrapping around (cp2.param < cp1.param indicates wrap from end to start)
@@ -559,7 +778,21 @@ def build_intermediate_control_points(cp1, cp2, num_intermediates, bias, reverse
     # When wrapping, we need to fill the gap from cp1.param to 1.0
     # For a closed loop, we split this into: cp1.param -> 1.0, and skip the 0.0 -> cp2.param segment
     # since cp2 is already at 0.0 (entry point)
-    
+
+    # If reverse_direction is True, invert the bias (1.0 - bias) to create symmetry
+    # This mirrors the bias curve shape while maintaining forward interpolation direction
+    if reverse_direction:
+        bias = 1.0 - bias
+
+    # Spans are loop-invariant; each intermediate only needs its bias weight
+    d_angle_dome = cp2.angle_dome - cp1.angle_dome
+    d_angle_bowl = cp2.angle_bowl - cp1.angle_bowl
+    d_mag_dome = cp2.mag_dome - cp1.mag_dome
+    d_mag_bowl = cp2.mag_bowl - cp1.mag_bowl
+
+    # Bias is fixed for this span
+    weight_at = make_bias_weight(bias)
+
     for i in range(1, num_intermediates + 1):
         # Parameter along the interval from cp1 to cp2
         t = float(i) / (num_intermediates + 1)
@@ -584,22 +817,12 @@ def build_intermediate_control_points(cp1, cp2, num_intermediates, bias, reverse
             # Normal interpolation (no wrap)
             param = cp1.param + (cp2.param - cp1.param) * t
 
-        # Interpolate angles and magnitudes with bias
-        # If reverse_direction is True, invert the bias (1.0 - bias) to create symmetry
-        # This mirrors the bias curve shape while maintaining forward interpolation direction
-        if reverse_direction:
-            # For symmetry: invert bias value to mirror the curve shape
-            inverted_bias = 1.0 - bias
-            angle_dome = interpolate_value(cp1.angle_dome, cp2.angle_dome, t, inverted_bias)
-            angle_bowl = interpolate_value(cp1.angle_bowl, cp2.angle_bowl, t, inverted_bias)
-            mag_dome = interpolate_value(cp1.mag_dome, cp2.mag_dome, t, inverted_bias)
-            mag_bowl = interpolate_value(cp1.mag_bowl, cp2.mag_bowl, t, inverted_bias)
-        else:
-            # Normal: interpolate from source toward target with original bias
-            angle_dome = interpolate_value(cp1.angle_dome, cp2.angle_dome, t, bias)
-            angle_bowl = interpolate_value(cp1.angle_bowl, cp2.angle_bowl, t, bias)
-            mag_dome = interpolate_value(cp1.mag_dome, cp2.mag_dome, t, bias)
-            mag_bowl = interpolate_value(cp1.mag_bowl, cp2.mag_bowl, t, bias)
+        # Interpolate angles and magnitudes with bias (one weight for all four)
+        weight = weight_at(t)
+        angle_dome = cp1.angle_dome + d_angle_dome * weight
+        angle_bowl = cp1.angle_bowl + d_angle_bowl * weight
+        mag_dome = cp1.mag_dome + d_mag_dome * weight
+        mag_bowl = cp1.mag_bowl + d_mag_bowl * weight
 
         # Create intermediate control point
         name = f"{cp1.name}_to_{cp2.name}_{i}"
@@ -640,8 +863,9 @@ def build_all_control_points(primary_cps, num_intermediates, transition_bias_for
     exit_param = exit_cp.param if exit_cp else 0.5
     tol = 1e-6
 
-    # Add intermediates between each consecutive pair
-    for i in range(len(primary_cps)):
+    # Add intermediates between each consecutive pair (none requested: the
+    # primaries alone define the belt, so there is no bias to resolve)
+    for i in range(len(primary_cps) if num_intermediates > 0 else 0):
         cp1 = primary_cps[i]
         cp2 = primary_cps[(i + 1) % len(primary_cps)]  # Wrap around to close the loop
 
@@ -651,7 +875,7 @@ def build_all_control_points(primary_cps, num_intermediates, transition_bias_for
             cp1, cp2, transition_bias_fore, transition_bias_aft, exit_param, tol
         )
 
-        if warnings is not None:
+        if DEBUG_ENABLED and warnings is not None:
             warnings.append(
                 f"DEBUG: Bias segment {cp1.name}->{cp2.name}: {bias_label}, bias={bias:.3f}, invert={reverse_direction}"
             )
@@ -660,22 +884,32 @@ def build_all_control_points(primary_cps, num_intermediates, transition_bias_for
         all_cps.extend(intermediates)
 
     # Sort by param
-    all_cps.sort(key=lambda cp: cp.param)
+    all_cps.sort(key=_by_param)
 
     # CRITICAL: Ensure closure by adding a point at param = 1.0 that matches entry (param = 0.0)
     # For a periodic closed loop, we MUST have a cross-section at both 0.0 and 1.0
     # These should be identical to ensure smooth closure
 
-    # Find entry point (param = 0.0)
+    # Find entry point (param = 0.0); after the sort it is normally the head
     entry_cp = None
-    for cp in all_cps:
-        if abs(cp.param) < 1e-6:  # Find entry point (param ~ 0.0)
-            entry_cp = cp
-            break
+    if all_cps and abs(all_cps[0].param) < 1e-6:
+        entry_cp = all_cps[0]
+    else:
+        for cp in all_cps:
+            if abs(cp.param) < 1e-6:  # Find entry point (param ~ 0.0)
+                entry_cp = cp
+                break
 
     if entry_cp:
-        # Check if we already have a point at exactly 1.0
-        has_closure = any(abs(cp.param - 1.0) < 1e-6 for cp in all_cps)
+        # Check if we already have a point at exactly 1.0, scanning back from
+        # the tail and stopping once params drop below 1.0
+        has_closure = False
+        for cp in reversed(all_cps):
+            if abs(cp.param - 1.0) < 1e-6:
+                has_closure = True
+                break
+            if cp.param < 1.0:
+                break
 
         if not has_closure:
             # Add closure point at param = 1.0 with same properties as entry
@@ -685,7 +919,9 @@ def build_all_control_points(primary_cps, num_intermediates, transition_bias_for
                 entry_cp.mag_dome, entry_cp.mag_bowl
             )
             all_cps.append(closure_cp)
-            all_cps.sort(key=lambda cp: cp.param)
+            # Already in order unless something sits past 1.0
+            if all_cps[-2].param > 1.0:
+                all_cps.sort(key=_by_param)
 
     return all_cps
 
@@ -770,6 +1006,10 @@ def generate_belt_surface(dome, bowl,
     norm_lines_belt_dome = []
     norm_lines_belt_bowl = []
 
+    # Document tolerance, read once for the whole build
+    tol = sc.doc.ModelAbsoluteTolerance
+    tol10 = tol * 10
+
     # ========================================================================
     # STEP 1: EXTRACT EDGE CURVES (RAILS)
     # ========================================================================
@@ -781,19 +1021,22 @@ def generate_belt_surface(dome, bowl,
         warnings.append("ERROR: Could not extract trim curves from surfaces")
         return (None, warnings, debug_curves, debug_vectors, norm_lines_dome, norm_lines_bowl, norm_lines_belt_dome, norm_lines_belt_bowl)
 
-    dome_edge_length = dome_edge.GetLength()
-    bowl_edge_length = bowl_edge.GetLength()
-
-    warnings.append(f"DEBUG: Dome edge length = {dome_edge_length:.2f}")
-    warnings.append(f"DEBUG: Bowl edge length = {bowl_edge_length:.2f}")
-    warnings.append(f"DEBUG: Length ratio (bowl/dome) = {bowl_edge_length/dome_edge_length:.3f}")
+    if DEBUG_ENABLED:
+        # Arc-length integration, only needed for these lines
+        dome_edge_length = dome_edge.GetLength()
+        bowl_edge_length = bowl_edge.GetLength()
+        warnings.extend([
+            f"DEBUG: Dome edge length = {dome_edge_length:.2f}",
+            f"DEBUG: Bowl edge length = {bowl_edge_length:.2f}",
+            f"DEBUG: Length ratio (bowl/dome) = {bowl_edge_length/dome_edge_length:.3f}",
+        ])
 
     # ========================================================================
     # STEP 2: FIND ENTRY POINTS ON RAILS (YZ plane intersections)
     # ========================================================================
 
-    dome_intersections = find_yz_plane_intersections(dome_edge)
-    bowl_intersections = find_yz_plane_intersections(bowl_edge)
+    dome_intersections = find_yz_plane_intersections(dome_edge, tol)
+    bowl_intersections = find_yz_plane_intersections(bowl_edge, tol)
 
     if not dome_intersections or not bowl_intersections:
         warnings.append("ERROR: Could not find YZ plane intersections")
@@ -802,13 +1045,20 @@ def generate_belt_surface(dome, bowl,
     dome_entry_param = dome_intersections['entry']['param']
     bowl_entry_param = bowl_intersections['entry']['param']
 
-    warnings.append(f"DEBUG: Dome entry param = {dome_entry_param:.4f}")
-    warnings.append(f"DEBUG: Bowl entry param = {bowl_entry_param:.4f}")
+    if DEBUG_ENABLED:
+        warnings.extend([
+            f"DEBUG: Dome entry param = {dome_entry_param:.4f}",
+            f"DEBUG: Bowl entry param = {bowl_entry_param:.4f}",
+        ])
 
     # ========================================================================
     # STEP 3: REORDER RAILS TO START AT ENTRY POINTS
     # ========================================================================
 
+    # Original domains, for mapping the STEP 2 params onto the reordered rails
+    dome_edge_t0, dome_edge_t1 = dome_edge.Domain.T0, dome_edge.Domain.T1
+    bowl_edge_t0, bowl_edge_t1 = bowl_edge.Domain.T0, bowl_edge.Domain.T1
+
     dome_rail = reorder_curve_to_start(dome_edge, dome_entry_param)
     bowl_rail = reorder_curve_to_start(bowl_edge, bowl_entry_param)
 
@@ -817,9 +1067,19 @@ def generate_belt_surface(dome, bowl,
     bowl_rail.Domain = rg.Interval(0.0, 1.0)
 
     # After reparameterizing, find the EXIT points (second YZ plane intersection)
-    # These should be at the opposite end of the curve
-    dome_intersections_reordered = find_yz_plane_intersections(dome_rail)
-    bowl_intersections_reordered = find_yz_plane_intersections(bowl_rail)
+    # These should be at the opposite end of the curve. Moving the seam to the
+    # entry and rescaling to [0, 1] is an affine shift of the STEP 2 params,
+    # so remap those and only intersect again if a remapped point doesn't match.
+    dome_intersections_reordered = remap_yz_intersections(
+        dome_rail, dome_intersections,
+        lambda t: ((t - dome_entry_param) % (dome_edge_t1 - dome_edge_t0)) / (dome_edge_t1 - dome_edge_t0), tol)
+    if not dome_intersections_reordered:
+        dome_intersections_reordered = find_yz_plane_intersections(dome_rail, tol)
+    bowl_intersections_reordered = remap_yz_intersections(
+        bowl_rail, bowl_intersections,
+        lambda t: ((t - bowl_entry_param) % (bowl_edge_t1 - bowl_edge_t0)) / (bowl_edge_t1 - bowl_edge_t0), tol)
+    if not bowl_intersections_reordered:
+        bowl_intersections_reordered = find_yz_plane_intersections(bowl_rail, tol)
 
     if not dome_intersections_reordered or not bowl_intersections_reordered:
         warnings.append("ERROR: Could not find YZ plane exit intersections after reordering")
@@ -829,8 +1089,11 @@ def generate_belt_surface(dome, bowl,
     dome_exit_param = dome_intersections_reordered['exit']['param']
     bowl_exit_param = bowl_intersections_reordered['exit']['param']
 
-    warnings.append(f"DEBUG: Dome exit param (after reorder) = {dome_exit_param:.4f}")
-    warnings.append(f"DEBUG: Bowl exit param (after reorder) = {bowl_exit_param:.4f}")
+    if DEBUG_ENABLED:
+        warnings.extend([
+            f"DEBUG: Dome exit param (after reorder) = {dome_exit_param:.4f}",
+            f"DEBUG: Bowl exit param (after reorder) = {bowl_exit_param:.4f}",
+        ])
 
     # ========================================================================
     # STEP 3.5: ALIGN CURVE DIRECTIONS
@@ -841,32 +1104,35 @@ def generate_belt_surface(dome, bowl,
     dome_tangent_start = dome_rail.TangentAt(dome_rail.Domain.Min)
     bowl_tangent_start = bowl_rail.TangentAt(bowl_rail.Domain.Min)
 
-    # Project tangents to XY plane (looking down from top)
-    dome_tangent_xy = rg.Vector3d(dome_tangent_start.X, dome_tangent_start.Y, 0)
-    bowl_tangent_xy = rg.Vector3d(bowl_tangent_start.X, bowl_tangent_start.Y, 0)
-
-    dome_tangent_xy.Unitize()
-    bowl_tangent_xy.Unitize()
-
-    # Dot product: positive = same direction, negative = opposite
-    dot_product = rg.Vector3d.Multiply(dome_tangent_xy, bowl_tangent_xy)
+    # Dot product of the tangents projected to the XY plane (looking down from
+    # top): positive = same direction, negative = opposite. Only the sign is
+    # used, so the projections don't need unitizing.
+    dot_product = (dome_tangent_start.X * bowl_tangent_start.X +
+                   dome_tangent_start.Y * bowl_tangent_start.Y)
 
     if dot_product < 0:
         # Curves travel in opposite directions, reverse bowl rail
         bowl_rail.Reverse()
-        warnings.append("DEBUG: Bowl rail reversed to match dome rail direction")
+        if DEBUG_ENABLED:
+            warnings.append("DEBUG: Bowl rail reversed to match dome rail direction")
 
         # CRITICAL: After reversing, we need to re-find the exit point
         # because the curve direction has changed
         bowl_rail.Domain = rg.Interval(0.0, 1.0)  # Re-reparameterize
-        bowl_intersections_reordered = find_yz_plane_intersections(bowl_rail)
+        # Reversing a [0, 1] rail and rescaling maps t to 1 - t
+        reversed_intersections = remap_yz_intersections(
+            bowl_rail, bowl_intersections_reordered, lambda t: 1.0 - t, tol)
+        bowl_intersections_reordered = (reversed_intersections or
+                                        find_yz_plane_intersections(bowl_rail, tol))
         if bowl_intersections_reordered:
             bowl_exit_param = bowl_intersections_reordered['exit']['param']
-            warnings.append(f"DEBUG: Bowl exit param (after reverse) = {bowl_exit_param:.4f}")
-    else:
+            if DEBUG_ENABLED:
+                warnings.append(f"DEBUG: Bowl exit param (after reverse) = {bowl_exit_param:.4f}")
+    elif DEBUG_ENABLED:
         warnings.append("DEBUG: Rails already travel in same direction")
 
-    warnings.append(f"DEBUG: Rails reordered and reparameterized to [0, 1]")
+    if DEBUG_ENABLED:
+        warnings.append(f"DEBUG: Rails reordered and reparameterized to [0, 1]")
 
     # ========================================================================
     # STEP 4: BUILD PRIMARY CONTROL POINTS
@@ -881,7 +1147,8 @@ def generate_belt_surface(dome, bowl,
         exit_angle_dome, exit_angle_bowl, exit_mag_dome, exit_mag_bowl
     )
 
-    warnings.append(f"DEBUG: Created {len(primary_cps)} primary control points")
+    if DEBUG_ENABLED:
+        warnings.append(f"DEBUG: Created {len(primary_cps)} primary control points")
 
     # ========================================================================
     # STEP 5: BUILD ALL CONTROL POINTS (PRIMARY + INTERMEDIATES)
@@ -889,10 +1156,11 @@ def generate_belt_surface(dome, bowl,
 
     all_cps = build_all_control_points(primary_cps, intermediate_sections, transition_bias_fore, transition_bias_aft, warnings=warnings)
 
-    warnings.append(f"DEBUG: Total control points (with intermediates) = {len(all_cps)}")
+    if DEBUG_ENABLED:
+        warnings.append(f"DEBUG: Total control points (with intermediates) = {len(all_cps)}")
 
     # Debug: Show parameter range
-    if all_cps:
+    if DEBUG_ENABLED and all_cps:
         min_param = min(cp.param for cp in all_cps)
         max_param = max(cp.param for cp in all_cps)
         warnings.append(f"DEBUG: Control point param range: {min_param:.6f} to {max_param:.6f}")
@@ -905,9 +1173,34 @@ def generate_belt_surface(dome, bowl,
     # STEP 6: CALCULATE VECTORS AT EACH CONTROL POINT
     # ========================================================================
 
+    dome_face = dome.Faces[0]
+    bowl_face = bowl.Faces[0]
+
+    # Surface normals and probe classifications by exact (u, v), one cache
+    # per face for this build
+    dome_normals = {}
+    bowl_normals = {}
+    dome_relations = {}
+    bowl_relations = {}
+
+    # Bounding-box centers are per face, not per control point
+    dome_center = dome_face.GetBoundingBox(True).Center
+    bowl_center = bowl_face.GetBoundingBox(True).Center
+
+    # Rail domains are fixed for the loop; map normalized params locally
+    # instead of fetching Domain and calling ParameterAt per control point
+    dome_t0 = dome_rail.Domain.T0
+    dome_span = dome_rail.Domain.T1 - dome_t0
+    bowl_t0 = bowl_rail.Domain.T0
+    bowl_span = bowl_rail.Domain.T1 - bowl_t0
+
+    # Last bowl point placed; its distance to the next dome point bounds that
+    # point's closest-point search (the bowl rail passes through it)
+    prev_bowl_point = None
+
     for cp in all_cps:
         # Get dome point at this parameter
-        dome_t = dome_rail.Domain.ParameterAt(cp.param)
+        dome_t = dome_t0 + dome_span * cp.param
         cp.dome_point = dome_rail.PointAt(dome_t)
 
         # NEW APPROACH: Entry/Exit use fixed YZ plane intersections
@@ -917,39 +1210,46 @@ def generate_belt_surface(dome, bowl,
         # SPECIAL CASES: Entry and Exit at YZ plane intersections
         if cp.name == "entry":
             # Entry at param 0.0 on both curves (YZ plane, most +Y)
-            bowl_t = bowl_rail.Domain.ParameterAt(0.0)
+            bowl_t = bowl_t0
             cp.bowl_point = bowl_rail.PointAt(bowl_t)
         elif cp.name == "exit":
             # Exit at YZ plane intersection on bowl
-            bowl_t = bowl_rail.Domain.ParameterAt(bowl_exit_param)
+            bowl_t = bowl_t0 + bowl_span * bowl_exit_param
             cp.bowl_point = bowl_rail.PointAt(bowl_t)
         elif cp.name == "closure":
             # Closure wraps back to entry (param 1.0 = param 0.0)
-            bowl_t = bowl_rail.Domain.ParameterAt(1.0)
+            bowl_t = bowl_t0 + bowl_span
             cp.bowl_point = bowl_rail.PointAt(bowl_t)
         else:
             # All other points (A, B, mirrors, intermediates): use CLOSEST POINT
-            success, bowl_t = bowl_rail.ClosestPoint(cp.dome_point)
+            success = False
+            if prev_bowl_point is not None:
+                max_dist = cp.dome_point.DistanceTo(prev_bowl_point) * 1.000001 + tol
+                success, bowl_t = bowl_rail.ClosestPoint(cp.dome_point, max_dist)
+            if not success:
+                success, bowl_t = bowl_rail.ClosestPoint(cp.dome_point)
             if not success:
                 warnings.append(f"ERROR: Could not find closest bowl point for {cp.name}")
                 continue
             cp.bowl_point = bowl_rail.PointAt(bowl_t)
+        prev_bowl_point = cp.bowl_point
 
         # Debug: verify entry/exit/closure points are in correct sectors
-        if cp.name == "entry":
-            warnings.append(f"DEBUG: Entry dome point X={cp.dome_point.X:.4f}, Y={cp.dome_point.Y:.4f} (X~0, Y should be positive)")
-            warnings.append(f"DEBUG: Entry bowl point X={cp.bowl_point.X:.4f}, Y={cp.bowl_point.Y:.4f} (X~0, Y should be positive)")
-        elif cp.name == "exit":
-            warnings.append(f"DEBUG: Exit dome point X={cp.dome_point.X:.4f}, Y={cp.dome_point.Y:.4f} (X~0, Y should be negative)")
-            warnings.append(f"DEBUG: Exit bowl point X={cp.bowl_point.X:.4f}, Y={cp.bowl_point.Y:.4f} (X~0, Y should be negative)")
-        elif cp.name == "closure":
-            warnings.append(f"DEBUG: Closure dome point X={cp.dome_point.X:.4f}, Y={cp.dome_point.Y:.4f} (should match Entry)")
-            warnings.append(f"DEBUG: Closure bowl point X={cp.bowl_point.X:.4f}, Y={cp.bowl_point.Y:.4f} (should match Entry)")
+        if DEBUG_ENABLED:
+            if cp.name == "entry":
+                warnings.append(f"DEBUG: Entry dome point X={cp.dome_point.X:.4f}, Y={cp.dome_point.Y:.4f} (X~0, Y should be positive)")
+                warnings.append(f"DEBUG: Entry bowl point X={cp.bowl_point.X:.4f}, Y={cp.bowl_point.Y:.4f} (X~0, Y should be positive)")
+            elif cp.name == "exit":
+                warnings.append(f"DEBUG: Exit dome point X={cp.dome_point.X:.4f}, Y={cp.dome_point.Y:.4f} (X~0, Y should be negative)")
+                warnings.append(f"DEBUG: Exit bowl point X={cp.bowl_point.X:.4f}, Y={cp.bowl_point.Y:.4f} (X~0, Y should be negative)")
+            elif cp.name == "closure":
+                warnings.append(f"DEBUG: Closure dome point X={cp.dome_point.X:.4f}, Y={cp.dome_point.Y:.4f} (should match Entry)")
+                warnings.append(f"DEBUG: Closure bowl point X={cp.bowl_point.X:.4f}, Y={cp.bowl_point.Y:.4f} (should match Entry)")
 
         # Calculate distance between dome and bowl at this location
         distance = cp.dome_point.DistanceTo(cp.bowl_point)
 
-        if distance < sc.doc.ModelAbsoluteTolerance:
+        if distance < tol:
             warnings.append(f"WARNING: Zero distance at {cp.name}")
             distance = 1.0
 
@@ -959,12 +1259,18 @@ def generate_belt_surface(dome, bowl,
         # The edge curve acts as an axle/axis at each location
         # The perpendicular vector rotates around this axle (curve tangent direction)
 
-        dome_perpendicular = get_perpendicular_to_trim(dome, dome_rail, dome_t)
+        # Edge point, tangent and surface UV/normal, evaluated once and shared
+        # by the perpendicular, the rotation axle and the cilia below
+        dome_frame = sample_trim_frame(dome_face, dome_rail, dome_t, dome_normals, cp.dome_point)
+        dome_perpendicular = None
+        if dome_frame:
+            dome_perpendicular = get_perpendicular_to_trim(dome, dome_rail, dome_t, dome_frame, dome_center,
+                                                           dome_relations, tol)
 
         if dome_perpendicular:
             # Get curve tangent - this is the AXLE around which we rotate
-            dome_curve_tangent = dome_rail.TangentAt(dome_t)
-            dome_curve_tangent.Unitize()
+            # (TangentAt is already unit length; rotate_vector normalizes the axis itself)
+            dome_curve_tangent = dome_frame[1]
 
             # Apply angle rotation around the curve tangent (the edge curve as axle)
             dome_vector = rotate_vector(dome_perpendicular, cp.angle_dome, dome_curve_tangent)
@@ -975,10 +1281,10 @@ def generate_belt_surface(dome, bowl,
             cp.dome_vector = dome_vector * (cp.mag_dome * distance)
 
             # Generate cilia curve from dome surface at this point
-            dome_face = dome.Faces[0]
-            success, dome_u, dome_v = dome_face.ClosestPoint(cp.dome_point)
-            if success and norm_length > 0:
-                dome_normal = dome_face.NormalAt(dome_u, dome_v)
+            # (cp.dome_point is the frame point, so reuse its UV and normal)
+            dome_u, dome_v = dome_frame[2], dome_frame[3]
+            if norm_length > 0:
+                dome_normal = rg.Vector3d(dome_frame[4])
                 dome_normal.Unitize()
                 
                 # Ensure normal points away from origin (0,0,0)
@@ -1024,12 +1330,16 @@ def generate_belt_surface(dome, bowl,
         # The edge curve acts as an axle/axis at each location
         # The perpendicular vector rotates around this axle (curve tangent direction)
 
-        bowl_perpendicular = get_perpendicular_to_trim(bowl, bowl_rail, bowl_t)
+        bowl_frame = sample_trim_frame(bowl_face, bowl_rail, bowl_t, bowl_normals, cp.bowl_point)
+        bowl_perpendicular = None
+        if bowl_frame:
+            bowl_perpendicular = get_perpendicular_to_trim(bowl, bowl_rail, bowl_t, bowl_frame, bowl_center,
+                                                           bowl_relations, tol)
 
         if bowl_perpendicular:
             # Get curve tangent - this is the AXLE around which we rotate
-            bowl_curve_tangent = bowl_rail.TangentAt(bowl_t)
-            bowl_curve_tangent.Unitize()
+            # (TangentAt is already unit length; rotate_vector normalizes the axis itself)
+            bowl_curve_tangent = bowl_frame[1]
 
             # Apply angle rotation around the curve tangent (the edge curve as axle)
             bowl_vector = rotate_vector(bowl_perpendicular, cp.angle_bowl, bowl_curve_tangent)
@@ -1040,10 +1350,10 @@ def generate_belt_surface(dome, bowl,
             cp.bowl_vector = bowl_vector * (cp.mag_bowl * distance)
 
             # Generate cilia curve from bowl surface at this point
-            bowl_face = bowl.Faces[0]
-            success, bowl_u, bowl_v = bowl_face.ClosestPoint(cp.bowl_point)
-            if success and norm_length > 0:
-                bowl_normal = bowl_face.NormalAt(bowl_u, bowl_v)
+            # (cp.bowl_point is the frame point, so reuse its UV and normal)
+            bowl_u, bowl_v = bowl_frame[2], bowl_frame[3]
+            if norm_length > 0:
+                bowl_normal = rg.Vector3d(bowl_frame[4])
                 bowl_normal.Unitize()
                 
                 # Create cilia curve (circle arc) driven by surface curvature inboard (90° to trim edge)
@@ -1084,15 +1394,18 @@ def generate_belt_surface(dome, bowl,
     # ========================================================================
 
     cross_sections = []
+    section_pts = System.Array.CreateInstance(rg.Point3d, 4)  # Reused for every section
 
     for cp in all_cps:
-        if cp.dome_point and cp.bowl_point and cp.dome_vector and cp.bowl_vector:
+        # STEP 6 fills points and vectors in order, bowl_vector last; it is
+        # only missing for control points STEP 6 had to skip
+        if cp.bowl_vector is not None:
             P0 = cp.dome_point
-            P1 = rg.Point3d(cp.dome_point + cp.dome_vector)
-            P2 = rg.Point3d(cp.bowl_point + cp.bowl_vector)
+            P1 = cp.dome_point + cp.dome_vector  # Point3d + Vector3d is a Point3d
+            P2 = cp.bowl_point + cp.bowl_vector
             P3 = cp.bowl_point
 
-            bezier = create_cubic_bezier(P0, P1, P2, P3)
+            bezier = create_cubic_bezier(P0, P1, P2, P3, section_pts)
 
             if bezier and bezier.IsValid:
                 cross_sections.append(bezier)
@@ -1101,7 +1414,8 @@ def generate_belt_surface(dome, bowl,
                 warnings.append(f"ERROR: Invalid bezier curve at {cp.name}")
                 return (None, warnings, debug_curves, debug_vectors, norm_lines_dome, norm_lines_bowl, norm_lines_belt_dome, norm_lines_belt_bowl)
 
-    warnings.append(f"DEBUG: Created {len(cross_sections)} cross-section curves")
+    if DEBUG_ENABLED:
+        warnings.append(f"DEBUG: Created {len(cross_sections)} cross-section curves")
 
     # Check if first and last cross-sections are duplicates (both at entry point)
     if len(cross_sections) > 1:
@@ -1113,13 +1427,15 @@ def generate_belt_surface(dome, bowl,
 
         distance = first_start.DistanceTo(last_start)
 
-        if distance < sc.doc.ModelAbsoluteTolerance * 10:
+        if distance < tol10:
             # Remove the duplicate closure curve for sweep
             cross_sections_for_sweep = cross_sections[:-1]
-            warnings.append(f"DEBUG: Removed duplicate closure curve, using {len(cross_sections_for_sweep)} sections for sweep")
+            if DEBUG_ENABLED:
+                warnings.append(f"DEBUG: Removed duplicate closure curve, using {len(cross_sections_for_sweep)} sections for sweep")
         else:
             cross_sections_for_sweep = cross_sections
-            warnings.append(f"DEBUG: No duplicate detected, using all {len(cross_sections_for_sweep)} sections")
+            if DEBUG_ENABLED:
+                warnings.append(f"DEBUG: No duplicate detected, using all {len(cross_sections_for_sweep)} sections")
     else:
         cross_sections_for_sweep = cross_sections
 
@@ -1135,16 +1451,19 @@ def generate_belt_surface(dome, bowl,
         bowl_rail,           # Rail 2
         cross_sections_for_sweep,      # Cross-section curves
         True,                # closed = True (closed in sweep direction to complete the loop)
-        sc.doc.ModelAbsoluteTolerance
+        tol
     )
 
     if not sweep_breps or len(sweep_breps) == 0:
         warnings.append("ERROR: Sweep 2 Rails failed")
-        warnings.append(f"DEBUG: Rail 1 IsValid = {dome_rail.IsValid}, IsClosed = {dome_rail.IsClosed}")
-        warnings.append(f"DEBUG: Rail 2 IsValid = {bowl_rail.IsValid}, IsClosed = {bowl_rail.IsClosed}")
-        warnings.append(f"DEBUG: Number of cross-sections used = {len(cross_sections_for_sweep)}")
-        warnings.append(f"DEBUG: First section valid = {cross_sections_for_sweep[0].IsValid if cross_sections_for_sweep else 'N/A'}")
-        warnings.append(f"DEBUG: Last section valid = {cross_sections_for_sweep[-1].IsValid if cross_sections_for_sweep else 'N/A'}")
+        if DEBUG_ENABLED:
+            warnings.extend([
+                f"DEBUG: Rail 1 IsValid = {dome_rail.IsValid}, IsClosed = {dome_rail.IsClosed}",
+                f"DEBUG: Rail 2 IsValid = {bowl_rail.IsValid}, IsClosed = {bowl_rail.IsClosed}",
+                f"DEBUG: Number of cross-sections used = {len(cross_sections_for_sweep)}",
+                f"DEBUG: First section valid = {cross_sections_for_sweep[0].IsValid if cross_sections_for_sweep else 'N/A'}",
+                f"DEBUG: Last section valid = {cross_sections_for_sweep[-1].IsValid if cross_sections_for_sweep else 'N/A'}",
+            ])
         return (None, warnings, debug_curves, debug_vectors, norm_lines_dome, norm_lines_bowl, norm_lines_belt_dome, norm_lines_belt_bowl)
 
     # Extract surface from Brep
@@ -1192,15 +1511,13 @@ def generate_belt_surface(dome, bowl,
                     # Get edge parameter for this point (use dome rail as edge reference)
                     success_edge, belt_edge_param_dome = dome_rail.ClosestPoint(cp.dome_point)
                     if not success_edge:
-                        dome_t = dome_rail.Domain.ParameterAt(cp.param)
+                        dome_t = dome_t0 + dome_span * cp.param
                         belt_edge_param_dome = dome_t
 
                     # Build inboard tangent direction on the belt surface:
                     # perpendicular to edge tangent, aligned toward bowl side (across the belt).
-                    edge_tan = dome_rail.TangentAt(belt_edge_param_dome)
-                    edge_tan.Unitize()
-                    candidate = rg.Vector3d.CrossProduct(belt_normal_dome, edge_tan)
-                    candidate.Unitize()
+                    edge_tan = dome_rail.TangentAt(belt_edge_param_dome)  # unit length
+                    candidate = cross_unit(belt_normal_dome, edge_tan)
 
                     to_bowl = cp.bowl_point - cp.dome_point
                     # project to_bowl onto belt tangent plane
@@ -1247,13 +1564,11 @@ def generate_belt_surface(dome, bowl,
                     # Get edge parameter for this point (use bowl rail as edge reference)
                     success_edge, belt_edge_param_bowl = bowl_rail.ClosestPoint(cp.bowl_point)
                     if not success_edge:
-                        bowl_t = bowl_rail.Domain.ParameterAt(cp.param)
+                        bowl_t = bowl_t0 + bowl_span * cp.param
                         belt_edge_param_bowl = bowl_t
 
-                    edge_tan = bowl_rail.TangentAt(belt_edge_param_bowl)
-                    edge_tan.Unitize()
-                    candidate = rg.Vector3d.CrossProduct(belt_normal_bowl, edge_tan)
-                    candidate.Unitize()
+                    edge_tan = bowl_rail.TangentAt(belt_edge_param_bowl)  # unit length
+                    candidate = cross_unit(belt_normal_bowl, edge_tan)
 
                     to_dome = cp.dome_point - cp.bowl_point
                     to_dome_proj = to_dome - (rg.Vector3d.Multiply(to_dome, belt_normal_bowl) * belt_normal_bowl)
@@ -1280,11 +1595,14 @@ def generate_belt_surface(dome, bowl,
             else:
                 warnings.append(f"WARNING: Could not find closest point on belt surface for bowl point at {cp.name}")
 
-        warnings.append(f"DEBUG: Generated {len(norm_lines_dome)} dome normal lines")
-        warnings.append(f"DEBUG: Generated {len(norm_lines_bowl)} bowl normal lines")
-        warnings.append(f"DEBUG: Generated {len(norm_lines_belt_dome)} belt-dome normal lines")
-        warnings.append(f"DEBUG: Generated {len(norm_lines_belt_bowl)} belt-bowl normal lines")
-    else:
+        if DEBUG_ENABLED:
+            warnings.extend([
+                f"DEBUG: Generated {len(norm_lines_dome)} dome normal lines",
+                f"DEBUG: Generated {len(norm_lines_bowl)} bowl normal lines",
+                f"DEBUG: Generated {len(norm_lines_belt_dome)} belt-dome normal lines",
+                f"DEBUG: Generated {len(norm_lines_belt_bowl)} belt-bowl normal lines",
+            ])
+    elif DEBUG_ENABLED:
         warnings.append(f"DEBUG: Skipping belt normal generation - norm_length = {norm_length}")
 
     # ========================================================================
@@ -1296,16 +1614,28 @@ def generate_belt_surface(dome, bowl,
             num_u_pts = belt_surface.Points.CountU
             num_v_pts = belt_surface.Points.CountV
 
-            rebuilt = belt_surface.Rebuild(
-                3,  # U degree
-                3,  # V degree
-                int(num_u_pts * 1.5),
-                int(num_v_pts * 1.5)
-            )
+            # Rebuild depends only on the swept surface, so when a solve
+            # reproduces the same sweep (e.g. an unrelated slider moved),
+            # reuse the previous refit instead of computing it again
+            rebuild_key = surface_content_key(belt_surface)
+            cache_key = "belt_rebuild_cache_" + str(ghenv.Component.InstanceGuid)
+            cached = sc.sticky.get(cache_key)
+            if cached is not None and cached[0] == rebuild_key:
+                rebuilt = cached[1].Duplicate()
+            else:
+                rebuilt = belt_surface.Rebuild(
+                    3,  # U degree
+                    3,  # V degree
+                    int(num_u_pts * 1.5),
+                    int(num_v_pts * 1.5)
+                )
+                if rebuilt:
+                    sc.sticky[cache_key] = (rebuild_key, rebuilt.Duplicate())
 
             if rebuilt:
                 belt_surface = rebuilt
-                warnings.append("DEBUG: Surface rebuilt successfully")
+                if DEBUG_ENABLED:
+                    warnings.append("DEBUG: Surface rebuilt successfully")
         except:
             warnings.append("WARNING: Surface rebuild failed")
 
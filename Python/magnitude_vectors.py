@@ -32,27 +32,21 @@ else:
 down_dir = rg.Vector3d(ref_dir)
 down_dir.Unitize()
 
-# 5. Lower ("mag_line") line, downward from mid_point
-start_lower = mid_point
-end_lower = mid_point + down_dir * -length
-mag_line = rg.Line(start_lower, end_lower).ToNurbsCurve()
-
-# 6. Upper line ("G3_line"), upward, scaled by G3_ratio
-start_upper = mid_point
-end_upper = mid_point + down_dir * (length * G3_ratio)
-G3_line = rg.Line(start_upper, end_upper).ToNurbsCurve()
-
-# 7. Rotation around equator (tangent at mid_point), using supplied angle
+# 5. Rotation around equator (tangent at mid_point), using supplied angle.
+# Both lines lie along the same direction through mid_point, so rotate that
+# one direction vector instead of building and transforming both curves.
 rot_rad = math.radians(angle)
 rot_axis = tangent # already unitized
-rot_center = mid_point
-rot_transform = rg.Transform.Rotation(rot_rad, rot_axis, rot_center)
+rot_dir = rg.Vector3d(down_dir)
+rot_dir.Rotate(rot_rad, rot_axis)
 
-mag_line.Transform(rot_transform)
-G3_line.Transform(rot_transform)
+# 6. Lower ("mag_line") line, downward from mid_point
+skirt_point = mid_point + rot_dir * -length
+mag_line = rg.Line(mid_point, skirt_point).ToNurbsCurve()
 
-skirt_point = mag_line.PointAtEnd
-G3_point = G3_line.PointAtEnd
+# 7. Upper line ("G3_line"), upward, scaled by G3_ratio
+G3_point = mid_point + rot_dir * (length * G3_ratio)
+G3_line = rg.Line(mid_point, G3_point).ToNurbsCurve()
 
 # Grasshopper outputs (assign as needed)
 # mag_line = mag_line
@@ -28,63 +28,84 @@ if S:
 
     if nurbs_surface:
         # Get control point grid dimensions
-        u_count = nurbs_surface.Points.CountU
-        v_count = nurbs_surface.Points.CountV
-
-        # Mirror transform across YZ plane (X=0)
-        mirror_plane = rg.Plane.WorldYZ
-        mirror_transform = rg.Transform.Mirror(mirror_plane)
-
-        # Create mirrored surface
-        mirrored_surface = nurbs_surface.Duplicate()
-        mirrored_surface.Transform(mirror_transform)
+        points = nurbs_surface.Points
+        u_count = points.CountU
+        v_count = points.CountV
+
+        # Read the control point grid once, row by row (u-major), as
+        # (x, y, z, weight) tuples
+        original = []
+        get_cp = points.GetControlPoint
+        for u in range(u_count):
+            for v in range(v_count):
+                cp = get_cp(u, v)
+                loc = cp.Location
+                original.append((loc.X, loc.Y, loc.Z, cp.Weight))
 
         # Determine which direction to flip by comparing first-to-last distances
         # The direction that spans the surface (larger distance) should be flipped
 
-        # Get corner control points
-        cp_u0v0 = nurbs_surface.Points.GetControlPoint(0, 0).Location
-        cp_u1v0 = nurbs_surface.Points.GetControlPoint(u_count - 1, 0).Location
-        cp_u0v1 = nurbs_surface.Points.GetControlPoint(0, v_count - 1).Location
+        # Get corner control points (from the grid already read)
+        x0, y0, z0 = original[0][:3]
+        xu, yu, zu = original[(u_count - 1) * v_count][:3]
+        xv, yv, zv = original[v_count - 1][:3]
 
-        # Calculate distances
-        u_span = cp_u0v0.DistanceTo(cp_u1v0)
-        v_span = cp_u0v0.DistanceTo(cp_u0v1)
+        # Calculate squared distances (same ordering as the distances, no sqrt)
+        u_span = (xu - x0) ** 2 + (yu - y0) ** 2 + (zu - z0) ** 2
+        v_span = (xv - x0) ** 2 + (yv - y0) ** 2 + (zv - z0) ** 2
 
         # Flip the direction with the smaller span (reversed logic)
         flip_u = u_span < v_span
 
-        # Create new surface by averaging control points
-        averaged_surface = nurbs_surface.Duplicate()
-
-        # Average each control point between original and mirrored
-        for u in range(u_count):
-            for v in range(v_count):
-                # Get control point from original surface
-                cp_original = nurbs_surface.Points.GetControlPoint(u, v)
+        # Mirror across the YZ plane (X=0): only X changes sign, weights are
+        # unchanged, so there is no need to duplicate and transform the surface
+        mirrored = [(-x, y, z, w) for x, y, z, w in original]
 
-                # Get corresponding control point from mirrored surface
-                # Flip the appropriate index based on which direction spans the surface
-                if flip_u:
-                    u_idx = (u_count - 1) - u
-                    v_idx = v
-                else:
-                    u_idx = u
-                    v_idx = (v_count - 1) - v
-
-                cp_mirrored = mirrored_surface.Points.GetControlPoint(u_idx, v_idx)
-
-                # Average the locations
-                avg_x = (cp_original.Location.X + cp_mirrored.Location.X) / 2.0
-                avg_y = (cp_original.Location.Y + cp_mirrored.Location.Y) / 2.0
-                avg_z = (cp_original.Location.Z + cp_mirrored.Location.Z) / 2.0
-
-                # Average the weight
-                avg_weight = (cp_original.Weight + cp_mirrored.Weight) / 2.0
-
-                # Set the averaged control point
-                new_cp = rg.ControlPoint(rg.Point3d(avg_x, avg_y, avg_z), avg_weight)
-                averaged_surface.Points.SetControlPoint(u, v, new_cp)
+        # Reorder the mirrored grid so each entry lines up with its original
+        # partner, flipping the appropriate index based on which direction
+        # spans the surface
+        if flip_u:
+            mirrored = [p for u in range(u_count - 1, -1, -1)
+                        for p in mirrored[u * v_count:(u + 1) * v_count]]
+        else:
+            mirrored = [p for u in range(u_count)
+                        for p in mirrored[u * v_count:(u + 1) * v_count][::-1]]
+
+        # Already symmetric (e.g. the output fed back in): averaging would
+        # reproduce the input, so pass a copy through and skip the rebuild
+        already_symmetric = all(
+            abs(o[0] - m[0]) < 1e-9 and abs(o[1] - m[1]) < 1e-9 and
+            abs(o[2] - m[2]) < 1e-9 and abs(o[3] - m[3]) < 1e-9
+            for o, m in zip(original, mirrored))
+
+        if already_symmetric:
+            # Copy, so downstream edits can't reach the input geometry
+            averaged_surface = nurbs_surface.Duplicate()
+        else:
+            # Create new surface by averaging control points. Every control point
+            # is overwritten below, so build an empty surface of the same shape
+            # and copy only the knot vectors rather than duplicating the input.
+            averaged_surface = rg.NurbsSurface.Create(
+                3, nurbs_surface.IsRational, nurbs_surface.OrderU, nurbs_surface.OrderV,
+                u_count, v_count)
+            for knots, source in ((averaged_surface.KnotsU, nurbs_surface.KnotsU),
+                                  (averaged_surface.KnotsV, nurbs_surface.KnotsV)):
+                for k in range(source.Count):
+                    knots[k] = source[k]
+
+            # Average each control point between original and mirrored, then write
+            # the results back in one pass
+            # (SetPoint takes the Euclidean location and weight as plain doubles,
+            # so no Point3d/ControlPoint is built per control point)
+            set_point = averaged_surface.Points.SetPoint
+            i = 0
+            for u in range(u_count):
+                for v in range(v_count):
+                    ox, oy, oz, ow = original[i]
+                    mx, my, mz, mw = mirrored[i]
+                    set_point(u, v, (ox + mx) * 0.5, (oy + my) * 0.5, (oz + mz) * 0.5,
+                              (ow + mw) * 0.5)
+                    i += 1
 
         # Output the symmetrical surface
         a = averaged_surface
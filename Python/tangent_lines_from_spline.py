@@ -15,47 +15,33 @@ import math
 # Line length
 line_length = 50.0
 
-# Get spline start and end points
-start_pt = spline.PointAtStart
-end_pt = spline.PointAtEnd
-
-# Get tangent vectors at start and end
+# Get spline start and end points and tangent vectors, one curve evaluation
+# per end: the frame origin is the point and its X axis the unit tangent
 # TangentAtStart points FROM start ALONG the curve (outboard)
 # TangentAtEnd points FROM end ALONG the curve continuation (outboard)
-start_tangent = spline.TangentAtStart
-end_tangent = spline.TangentAtEnd
+domain = spline.Domain
+ok_start, start_frame = spline.FrameAt(domain.T0)
+ok_end, end_frame = spline.FrameAt(domain.T1)
+if ok_start and ok_end:
+    start_pt = start_frame.Origin
+    end_pt = end_frame.Origin
+    start_tangent = start_frame.XAxis
+    end_tangent = end_frame.XAxis
+else:
+    # No frame (e.g. zero curvature at an end): evaluate separately
+    start_pt = spline.PointAtStart
+    end_pt = spline.PointAtEnd
+    start_tangent = spline.TangentAtStart
+    end_tangent = spline.TangentAtEnd
 
 # For inboard direction:
 # Start: tangent already points into the curve, keep it as-is
 # End: tangent points away from curve, reverse it to point inboard
+# (the tangents are already unit length, and each property read returns its
+# own copy, so reverse that copy in place)
 start_tangent_inboard = start_tangent   # Keep as-is (points into curve)
-end_tangent_inboard = -end_tangent      # Reverse (points back toward curve)
-
-# Normalize tangents
-start_tangent_inboard.Unitize()
-end_tangent_inboard.Unitize()
-
-# Function to rotate a vector in YZ plane around a point
-def rotate_vector_yz(vector, angle_degrees):
-    """Rotate a vector in the YZ plane (around X axis)"""
-    angle_rad = math.radians(angle_degrees)
-
-    # Extract components
-    x = vector.X
-    y = vector.Y
-    z = vector.Z
-
-    # Rotate in YZ plane (around X axis)
-    # X remains unchanged
-    # Y' = Y * cos(θ) - Z * sin(θ)
-    # Z' = Y * sin(θ) + Z * cos(θ)
-    cos_a = math.cos(angle_rad)
-    sin_a = math.sin(angle_rad)
-
-    y_new = y * cos_a - z * sin_a
-    z_new = y * sin_a + z * cos_a
-
-    return rg.Vector3d(x, y_new, z_new)
+end_tangent_inboard = end_tangent
+end_tangent_inboard.Reverse()           # Reverse (points back toward curve)
 
 # Determine which endpoint is entry (more positive Y) and which is exit
 if start_pt.Y > end_pt.Y:
@@ -64,27 +50,50 @@ if start_pt.Y > end_pt.Y:
     exit_pt = end_pt
     entry_tangent = start_tangent_inboard
     exit_tangent = end_tangent_inboard
-    entry_angle_val = entry_angle
-    exit_angle_val = exit_angle
 else:
     # End point is entry, start point is exit
     entry_pt = end_pt
     exit_pt = start_pt
     entry_tangent = end_tangent_inboard
     exit_tangent = start_tangent_inboard
-    entry_angle_val = entry_angle
-    exit_angle_val = exit_angle
-
-# Rotate tangent vectors in YZ plane
-entry_tangent_rotated = rotate_vector_yz(entry_tangent, entry_angle_val)
-exit_tangent_rotated = rotate_vector_yz(exit_tangent, exit_angle_val)
 
-# Normalize rotated vectors and scale to line length
-entry_tangent_rotated.Unitize()
-entry_tangent_rotated *= line_length
+# Angles follow the entry/exit roles, not the curve direction
+entry_angle_val = entry_angle
+exit_angle_val = exit_angle
 
-exit_tangent_rotated.Unitize()
-exit_tangent_rotated *= line_length
+if entry_angle_val == 0 and exit_angle_val == 0:
+    # No rotation (straight tangent extension): just scale to line length
+    entry_tangent_rotated = entry_tangent * line_length
+    exit_tangent_rotated = exit_tangent * line_length
+else:
+    # Rotate tangent vectors in YZ plane (around X axis)
+    # X remains unchanged
+    # Y' = Y * cos(θ) - Z * sin(θ)
+    # Z' = Y * sin(θ) + Z * cos(θ)
+    entry_rad = math.radians(entry_angle_val)
+    cos_entry = math.cos(entry_rad)
+    sin_entry = math.sin(entry_rad)
+    if exit_angle_val == entry_angle_val:
+        # Same angle (the usual case): share the trig pair
+        cos_exit, sin_exit = cos_entry, sin_entry
+    else:
+        exit_rad = math.radians(exit_angle_val)
+        cos_exit = math.cos(exit_rad)
+        sin_exit = math.sin(exit_rad)
+
+    entry_tangent_rotated = rg.Vector3d(
+        entry_tangent.X,
+        entry_tangent.Y * cos_entry - entry_tangent.Z * sin_entry,
+        entry_tangent.Y * sin_entry + entry_tangent.Z * cos_entry)
+    exit_tangent_rotated = rg.Vector3d(
+        exit_tangent.X,
+        exit_tangent.Y * cos_exit - exit_tangent.Z * sin_exit,
+        exit_tangent.Y * sin_exit + exit_tangent.Z * cos_exit)
+
+    # Scale to line length (the tangents are unit length and the YZ
+    # rotation preserves length, so the rotated vectors are already unit)
+    entry_tangent_rotated *= line_length
+    exit_tangent_rotated *= line_length
 
 # Create lines from endpoints extending inboard
 entry_line = rg.Line(entry_pt, entry_pt + entry_tangent_rotated)